@@ -7,6 +7,7 @@ from typing import (
     Dict,
     List,
     Set,
+    Tuple,
     Optional,
     Any,
     Self,
@@ -15,21 +16,22 @@ from typing import (
 
 import os
 import sys
+import copy
 import datetime
 import time
 import threading
-import asyncio
+import concurrent.futures
 import collections
-import yaml
+import heapq
+import itertools
 import json
-import yaml.parser
-import http.server
+import dataclasses
 
 import core.existing_writers
-import core.api_server
 import core.plugin_interface
 import core.schedule_interface
-import core.network_interface
+# note: core.api_server and core.network_interface are imported on first use,
+# in Core.__init__, to keep them (and http.server) off the import path
 
 import ordinance.exceptions
 import ordinance.network
@@ -52,6 +54,7 @@ default_config_yaml = f"""#
 
 core:
   scheduler_tick: 30
+  max_workers: 32
 
 api:
   http_server:
@@ -73,40 +76,160 @@ writers:
   notif:
     dbus_username:
 """
+# the parsed form of default_config_yaml, kept as a literal so the no-config
+# path never touches yaml. keep these two in sync!
+_DEFAULT_CONFIG: Dict[str, Any] = {
+    'core': {
+        'scheduler_tick': 30,
+        'max_workers': 32,
+    },
+    'api': {
+        'http_server': {
+            'interface': None,
+            'port': None,
+        },
+    },
+    'writers': {
+        'enabled': ['stdout', 'logfile'],
+        'logfile': {
+            'files': [
+                { 'path': 'logs/debug.log',     'mask': 0b1111111 },
+                { 'path': 'logs/standard.log',  'mask': 0b1111110 },
+                { 'path': 'logs/important.log', 'mask': 0b1110000 },
+            ],
+        },
+        'notif': {
+            'dbus_username': None,
+        },
+    },
+}
+
+# parsed configs, keyed by real path, as (mtime_ns, size, conf). callers get a
+# deep copy, since the returned config is free to be mutated
+_CONFIG_CACHE: "collections.OrderedDict[str, Tuple[int, int, Dict[str, Any]]]" = collections.OrderedDict()
+_CONFIG_CACHE_MAX = 100
+
+# parsed configs are also written next to the yaml as json, which is much
+# cheaper to parse on the next start. a sidecar is only used if it was written
+# for the yaml's exact mtime and size; sidecars from another version are ignored
+_CONFIG_SIDECAR_SCHEMA = VERSION
+
+def _read_config_sidecar(sidecar_path: str, config_stat: os.stat_result) -> Optional[Dict[str, Any]]:
+    """ Returns the config cached in the json sidecar, or None if it is missing or stale. """
+    try:
+        with open(sidecar_path, 'rb') as file:
+            sidecar = json.load(file)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(sidecar, dict) or sidecar.get('_schema') != _CONFIG_SIDECAR_SCHEMA:
+        return None
+    if sidecar.get('_source') != [config_stat.st_mtime_ns, config_stat.st_size]:
+        return None
+    return sidecar.get('config')
+
+def _write_config_sidecar(sidecar_path: str, config_stat: os.stat_result, conf: Dict[str, Any]) -> None:
+    """ Writes the json sidecar for this config, if it survives a json roundtrip. """
+    try:
+        dat = json.dumps({ '_schema': _CONFIG_SIDECAR_SCHEMA,
+                           '_source': [config_stat.st_mtime_ns, config_stat.st_size],
+                           'config': conf })
+        if json.loads(dat)['config'] != conf:
+            return  # non-str keys, dates, etc; json can't represent this config
+        tmp_path = f"{sidecar_path}.tmp"
+        with open(tmp_path, 'w') as file:
+            file.write(dat)
+        os.replace(tmp_path, sidecar_path)
+    except (OSError, TypeError, ValueError):
+        pass  # the sidecar is only an optimization
 
 def _safe_load_config_path(config_path: str, _make_if_missing: bool = True) -> Dict[str, Any]:
     try:
-        with open(config_path, 'r') as file:
-            conf = yaml.safe_load(file.read())
-        if conf is None: return {}
-        else: return conf
+        real_path = os.path.realpath(config_path)
+        stat = os.stat(real_path)
+        cached = _CONFIG_CACHE.get(real_path)
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            _CONFIG_CACHE.move_to_end(real_path)
+            return copy.deepcopy(cached[2])
+        sidecar_path = f"{real_path}.cache.json"
+        conf = _read_config_sidecar(sidecar_path, stat)
+        if conf is None:
+            # yaml is imported here rather than at module scope, since a warm
+            # sidecar means it's never needed. prefer the libyaml C bindings
+            # when available; they parse identically to SafeLoader, just faster
+            import yaml
+            # binary mode: the loader streams and decodes it itself, skipping
+            # the text layer
+            with open(real_path, 'rb') as file:
+                try: conf = yaml.load(file, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
+                except yaml.YAMLError as e:
+                    raise ordinance.exceptions.ConfigSyntaxError(config_path, e) from e
+            if conf is None: conf = {}
+            _write_config_sidecar(sidecar_path, stat, conf)
+        _CONFIG_CACHE[real_path] = (stat.st_mtime_ns, stat.st_size, conf)
+        _CONFIG_CACHE.move_to_end(real_path)
+        if len(_CONFIG_CACHE) > _CONFIG_CACHE_MAX:
+            _CONFIG_CACHE.popitem(last=False)
+        return copy.deepcopy(conf)
     except FileNotFoundError:
-        default = yaml.safe_load(default_config_yaml)
         if _make_if_missing:
             print(f"Config file {config_path} not found, creating with default...")
-            with open(config_path, 'w') as file:
-                file.write(default_config_yaml)
+            try: fd = os.open(config_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+            except FileExistsError:
+                # something else created it in the meantime; use theirs
+                return _safe_load_config_path(config_path, _make_if_missing=False)
+            try: os.write(fd, default_config_yaml.encode())
+            finally: os.close(fd)
         else: print(f"Config file {config_path} not found, using default.")
-        return default_config_yaml
-    except yaml.parser.ParserError as e:
-        raise ordinance.exceptions.ConfigSyntaxError(path, e) from e
-
-
-def async_join_threads(threads: List[threading.Thread], timeout: Optional[float] = None) -> List[threading.Thread]:
-    try:
-        loop = asyncio.get_event_loop()
-    except:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-    async def join_one(th):
-        th.join(timeout)
-    async def join_all():
-        await asyncio.gather(*[
-            join_one(th) for th in threads
-        ], return_exceptions=True)
-    loop.run_until_complete(join_all())
-    loop.stop(); loop.close()
-    return [th for th in threads if th.is_alive()]
+        return copy.deepcopy(_DEFAULT_CONFIG)
+
+
+_MISSING = object()
+
+def _cget(d: Dict[str, Any], path: str, default: Any = None) -> Any:
+    """ Reads a dotted key path (eg. 'core.scheduler_tick') out of nested dicts.
+    Returns default if any step is missing, or is not itself a dict. """
+    cur = d
+    for key in path.split('.'):
+        if not isinstance(cur, dict): return default
+        cur = cur.get(key, _MISSING)
+        if cur is _MISSING: return default
+    return cur
+
+
+class _CoreCfg:
+    """ The core's own settings, read out of the parsed config once at startup. """
+    __slots__ = (
+        'sched_tick', 'max_workers',
+        'http_enabled', 'http_iface', 'http_port',
+        'writers_enabled', 'writers_cfgs',
+        'plugin_cfgs'
+    )
+
+    @classmethod
+    def _parse_config(cls, conf: Dict[str, Any]) -> Self:
+        cfg = cls()
+        # note: `x or {}` where the value is a section, since a key left blank
+        # in the yaml is present, but None
+        cfg.sched_tick  = _cget(conf, 'core.scheduler_tick', 30)
+        cfg.max_workers = _cget(conf, 'core.max_workers', 32)
+        cfg.http_enabled = _cget(conf, 'api.http_server') is not None
+        cfg.http_iface = _cget(conf, 'api.http_server.interface')
+        cfg.http_port  = _cget(conf, 'api.http_server.port')
+        cfg.writers_enabled = _cget(conf, 'writers.enabled') or []
+        cfg.writers_cfgs = \
+            { name: _cget(conf, f'writers.{name}') or {} for name in cfg.writers_enabled }
+        cfg.plugin_cfgs = \
+            { key[len('plugin.'):]: val or {} for key,val in conf.items() if key.startswith('plugin.') }
+        return cfg
+
+
+@dataclasses.dataclass(slots=True)
+class _PluginSlot:
+    """ Everything the core tracks for one plugin, loaded or not. """
+    instance:  Optional[ordinance.plugin.OrdinancePlugin] = None
+    schedules: Optional[Dict[str, ordinance.schedule.ScheduledFunction]] = None
+    commands:  Optional[Dict[str, ...]] = None
+    loaded:    bool = False
 
 
 class Core:
@@ -122,14 +245,12 @@ class Core:
             do_api_server = False
         
         # read config from file
-        self.__config = _safe_load_config_path(config_path)
+        self.__cfg = _CoreCfg._parse_config(_safe_load_config_path(config_path))
         
         # initialize writers
         core.existing_writers.add_known_writers()
-        writer_configs = self.__config.get('writers', {})
-        enabled_writers = writer_configs.get('enabled', [])
-        for writer in enabled_writers:
-            this_writer_config = writer_configs.get(writer, {})
+        for writer in self.__cfg.writers_enabled:
+            this_writer_config = self.__cfg.writers_cfgs[writer]
             try: ordinance.writer.enable(writer, this_writer_config)
             except ordinance.exceptions.WriterNotFound:
                 warning = f"Unknown writer type '{writer}' in config writers.enabled\n" + \
@@ -145,50 +266,70 @@ class Core:
                     print(e)
         
         # initialize networking module
-        core.network_interface.read_dbs()
-        core.network_interface.setup_iptables()
-
-        self.active_threads: List[threading.Thread] = []
+        from core import network_interface
+        network_interface.read_dbs()
+        network_interface.setup_iptables()
+
+        # triggers run on a shared worker pool. finished futures push themselves
+        # onto __done_futures; the scheduler reaps those each tick
+        self.__pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.__cfg.max_workers, thread_name_prefix='Ord-sched')
+        self.active_futures: Set[concurrent.futures.Future] = set()
+        self.__done_futures = collections.deque()  # note: deque is threadsafe
+        # wakes the scheduler early, when the triggers change or on stop()
+        self.__sched_wake = threading.Event()
         # initialize plugins list
         all_qnames = core.plugin_interface.fetch_all_qnames()
-        self.__plugins: Dict[str, ordinance.plugin.OrdinancePlugin] = \
-            { qname: None for qname in all_qnames }
-        self.__schedules: Dict[str, Dict[str, ordinance.schedule.ScheduledFunction]] = \
-            { qname: None for qname in all_qnames }
-        self.__commands: Dict[str, Dict[str, ...]] = \
-            { qname: None for qname in all_qnames }
-        if load_plugins:
-            for qname in self.__plugins.keys():
-                self.plugin_load(qname)
+        self.__plugins: Dict[str, _PluginSlot] = \
+            { qname: _PluginSlot() for qname in all_qnames }
+        # read-mostly views of loaded plugins' triggers, for the scheduler and
+        # event paths. these are rebuilt on load/unload (never mutated in place)
+        # and published by plain assignment, so readers on other threads never
+        # see a partial update. time-based triggers are bucketed by type...
+        self.__triggers_calendar: Tuple[Tuple[ordinance.plugin.OrdinancePlugin, ordinance.schedule.ScheduledFunction, ordinance.schedule.CalendarTrigger], ...] = ()
+        self.__triggers_delay:    Tuple[Tuple[ordinance.plugin.OrdinancePlugin, ordinance.schedule.ScheduledFunction, ordinance.schedule.DelayTrigger], ...]    = ()
+        self.__triggers_periodic: Tuple[Tuple[ordinance.plugin.OrdinancePlugin, ordinance.schedule.ScheduledFunction, ordinance.schedule.PeriodicTrigger], ...] = ()
+        # ...and event triggers are indexed by event name
+        self.__event_index: Dict[str, Tuple[Tuple[ordinance.plugin.OrdinancePlugin, ordinance.schedule.ScheduledFunction, ordinance.schedule.EventTrigger], ...]] = {}
+        if load_plugins and self.__plugins:
+            # plugin.yaml reads and parses are independent, so overlap them;
+            # module import and construction stay serial, in qname order
+            qnames = list(self.__plugins.keys())
+            with concurrent.futures.ThreadPoolExecutor(max_workers=min(8, len(qnames))) as prep_pool:
+                prepped = { qname: prep_pool.submit(self._plugin_prep, qname) for qname in qnames }
+                for qname in qnames:
+                    self._plugin_load(qname, prepped[qname])
         
         # initialize scheduler stuffs
-        sched_tick = self.__config.get('core', {}).get('scheduler_tick', 30)
+        # note: the scheduler sleeps until the next trigger is due; the tick
+        # only caps how long it sleeps in one go
+        sched_tick = self.__cfg.sched_tick
         ordinance.writer.debug(f"Using scheduler tick = {sched_tick}")
-        sched_subtick = self.__config.get('core', {}).get('scheduler_subtick', 5)
-        ordinance.writer.debug(f"Using scheduler subtick = {sched_subtick}")
         self.__scheduler_thread = threading.Thread(
-            target=self._scheduler_loop, args=(sched_tick, sched_subtick,),
+            target=self._scheduler_loop, args=(sched_tick,),
             name='Ordinance-scheduler')
-        self.__event_queue = collections.deque()  # note: deque is threadsafe
-        self._scheduler_should_run = True
+        self._shutdown_evt = threading.Event()
         self.__scheduler_thread.start()
         
         # initialize api server stuffs
-        core.api_server.ApiRequestHandler._core_ref = self
-        api_config = self.__config.get('api', {})
-        http_server_config = api_config.get('http_server', None)
-        if http_server_config is None: do_api_server = False
-        http_server_interface = http_server_config.get('interface', None)
-        http_server_port = http_server_config.get('port', None)
-        self.__api_server = core.api_server.ApiServer(bind=(http_server_interface, http_server_port), poll_interval=1.0)
-        if do_api_server: self.__api_server.start()
+        self.__api_server = None
+        if do_api_server and self.__cfg.http_enabled:
+            from core import api_server
+            api_server.ApiRequestHandler._core_ref = self
+            self.__api_server = api_server.ApiServer(bind=(self.__cfg.http_iface, self.__cfg.http_port), poll_interval=1.0)
+            self.__api_server.start()
         
         # announce start
         global VERSION
         self.__core_running = True
         if safe_mode: VERSION += " (Safe Mode)"
-        ordinance.writer.debug("Running with plugins:", *self.__plugins.keys())
-        ordinance.writer.debug("Running with writers:", *ordinance.writer.get_enabled())
+        # yaml is only loaded if some file needed parsing this run
+        yaml = sys.modules.get('yaml')
+        if yaml is not None and not yaml.__with_libyaml__:
+            ordinance.writer.info("libyaml not found, falling back to the (slower) pure-python YAML loader")
+        if ordinance.writer.is_debug_enabled():
+            ordinance.writer.debug("Running with plugins:", *self.__plugins.keys())
+            ordinance.writer.debug("Running with writers:", *ordinance.writer.get_enabled())
         ordinance.writer.success(f"Initialized Ordinance Core v{VERSION}")
     
     
@@ -197,16 +338,19 @@ class Core:
             raise Exception("Already stopped")
         
         # announce stop
-        ordinance.writer.debug("Stopping plugins:", *self.__plugins.keys())
-        ordinance.writer.debug("Stopping writers:", *ordinance.writer.get_enabled())
+        if ordinance.writer.is_debug_enabled():
+            ordinance.writer.debug("Stopping plugins:", *self.__plugins.keys())
+            ordinance.writer.debug("Stopping writers:", *ordinance.writer.get_enabled())
 
         # stop webserver stuffs
-        self.__api_server.stop()
+        if self.__api_server is not None:
+            self.__api_server.stop()
         
         # ensure scheduler and plugins are stopped
-        for qname in self.__plugins.keys():
-            self.plugin_unload(qname)
-        self._scheduler_should_run = False
+        for qname,slot in self.__plugins.items():
+            if slot.loaded: self.plugin_unload(qname)
+        self._shutdown_evt.set()
+        self.__sched_wake.set()
         self.__scheduler_thread.join()
         
         # stop networking module
@@ -229,37 +373,56 @@ class Core:
     def is_running(self) -> bool: return self.__core_running
 
 
+    def _plugin_prep(self, qname: str) -> Tuple[str, Dict[str, str], Dict[str, Any]]:
+        """ Reads plugin.yaml and merges its default config with ours. Safe to run off-thread. """
+        entry_file, meta, default_conf = core.plugin_interface.load_plugin_yaml(qname)
+        conf_from_main = self.__cfg.plugin_cfgs.get(qname, {})
+        conf = core.plugin_interface.deep_merge(default_conf, conf_from_main)
+        return entry_file, meta, conf
+
+
+    def _plugin_instantiate(self, qname: str, entry_file: str, meta: Dict[str, str], conf: Dict[str, Any]) \
+            -> Tuple[ordinance.plugin.OrdinancePlugin, Dict[str, ordinance.schedule.ScheduledFunction], Dict[str, ...]]:
+        ordinance.writer.debug(f"loading plugin module...")
+        module = core.plugin_interface.load_module_from_file(qname, entry_file)
+        
+        ordinance.writer.debug(f"defining plugin class from module...")
+        plugin_class = core.plugin_interface.define_plugin_from_module(qname, module)
+
+        ordinance.writer.debug(f"doing plugin preinit...")
+        core.plugin_interface.write_metadata(plugin_class, qname, meta)
+        scheds = core.plugin_interface.extract_scheduler_funcs(plugin_class)
+        cmds = core.plugin_interface.extract_command_funcs(plugin_class)
+
+        ordinance.writer.debug(f"creating plugin object...")
+        return plugin_class(conf), scheds, cmds
+
+
     def plugin_load(self, qname: str) -> None:
+        self._plugin_load(qname)
+
+
+    def _plugin_load(self, qname: str, prepped: Optional[concurrent.futures.Future] = None) -> None:
         ordinance.writer.debug(f"considering qname {qname} for load...")
-        if qname not in self.__plugins.keys():
+        slot = self.__plugins.get(qname)
+        if slot is None:
             raise ordinance.exceptions.PluginNotFound(qname)
-        if self.__plugins[qname] is not None:
+        if slot.loaded:
             raise ordinance.exceptions.PluginAlreadyLoaded(qname)
         
         try:
             ordinance.writer.debug(f"qname {qname} in good state for load; loading plugin information...")
-            entry_file, meta, default_conf = core.plugin_interface.load_plugin_yaml(qname)
-            
-            ordinance.writer.debug(f"loading plugin module...")
-            module = core.plugin_interface.load_module_from_file(qname, entry_file)
-            
-            ordinance.writer.debug(f"defining plugin class from module...")
-            plugin_class = core.plugin_interface.define_plugin_from_module(qname, module)
-
-            ordinance.writer.debug(f"doing plugin preinit...")
-            core.plugin_interface.write_metadata(plugin_class, qname, meta)
-            scheds = core.plugin_interface.extract_scheduler_funcs(plugin_class)
-            cmds = core.plugin_interface.extract_command_funcs(plugin_class)
-
-            ordinance.writer.debug(f"creating plugin object...")
-            conf_from_main = self.__config.get('plugin.'+qname, {})
-            conf = core.plugin_interface.deep_merge(default_conf, conf_from_main)
-            plugin = plugin_class(conf)
+            entry_file, meta, conf = prepped.result() if prepped is not None else self._plugin_prep(qname)
+            plugin, scheds, cmds = self._plugin_instantiate(qname, entry_file, meta, conf)
         
         except Exception as e:
-            self.__plugins[qname]   = None
-            self.__schedules[qname] = None
-            self.__commands[qname]  = None
+            self.__plugins[qname] = _PluginSlot()
+            # drop the module if it got as far as being imported, so the next
+            # load runs it again rather than reusing a half-loaded one
+            module = sys.modules.get(qname)
+            spec = getattr(module, '__spec__', None)
+            if spec is not None and spec.name.startswith(f"extensions.{qname}."):
+                del sys.modules[qname]
             ordinance.writer.debug(f"plugin {qname} load failed. error:")
             ordinance.writer.debug(e)
             ordinance.writer.error(f"Plugin {qname} load failed, with error:", repr(e))
@@ -267,27 +430,61 @@ class Core:
         else:
             ordinance.writer.debug(f"all ok. saving plugin {qname}.")
             ordinance.writer.success(f"Loaded plugin {qname}")
-            self.__plugins[qname] = plugin
-            self.__schedules[qname] = scheds
-            self.__commands[qname] = cmds
+            self.__plugins[qname] = _PluginSlot(plugin, scheds, cmds, loaded=True)
+            self.__bucket_triggers(plugin, scheds)
             self.fire_event('ordinance:plugin.start', plugins_list=[qname])
 
 
+    def __bucket_triggers(self, plugin: ordinance.plugin.OrdinancePlugin, scheds: Dict[str, ordinance.schedule.ScheduledFunction]) -> None:
+        # note: triggers are bucketed once, on load; triggers added to a
+        # schedule after its plugin is loaded are picked up on the next load
+        cal, dly, per = [], [], []
+        evt: Dict[str, list] = {}
+        for sched in scheds.values():
+            for trig in sched._get_triggers():
+                if   isinstance(trig, ordinance.schedule.CalendarTrigger): cal.append((plugin, sched, trig))
+                elif isinstance(trig, ordinance.schedule.DelayTrigger):    dly.append((plugin, sched, trig))
+                elif isinstance(trig, ordinance.schedule.PeriodicTrigger): per.append((plugin, sched, trig))
+                elif isinstance(trig, ordinance.schedule.EventTrigger):    evt.setdefault(trig.event, []).append((plugin, sched, trig))
+        self.__triggers_calendar += tuple(cal)
+        self.__triggers_delay    += tuple(dly)
+        self.__triggers_periodic += tuple(per)
+        if cal or dly or per: self.__sched_wake.set()
+        if evt:
+            index = dict(self.__event_index)
+            for event,subs in evt.items():
+                index[event] = index.get(event, ()) + tuple(subs)
+            self.__event_index = index
+
+
+    def __unbucket_triggers(self, plugin: ordinance.plugin.OrdinancePlugin) -> None:
+        self.__triggers_calendar = tuple(ent for ent in self.__triggers_calendar if ent[0] is not plugin)
+        self.__triggers_delay    = tuple(ent for ent in self.__triggers_delay    if ent[0] is not plugin)
+        self.__triggers_periodic = tuple(ent for ent in self.__triggers_periodic if ent[0] is not plugin)
+        self.__sched_wake.set()
+        index = {}
+        for event,subs in self.__event_index.items():
+            subs = tuple(ent for ent in subs if ent[0] is not plugin)
+            if subs: index[event] = subs
+        self.__event_index = index
+
+
     def plugin_unload(self, qname: str) -> None:
         ordinance.writer.debug(f"considering qname {qname} for unload...")
-        if qname not in self.__plugins:
+        slot = self.__plugins.get(qname)
+        if slot is None:
             raise ordinance.exceptions.PluginNotFound(qname)
-        if self.__plugins[qname] is None:
+        if not slot.loaded:
             raise ordinance.exceptions.PluginAlreadyLoaded(qname)
         
         try:
             ordinance.writer.debug(f"qname {qname} in good state for unload; doing predel...")
 
             # fire and handle plugin stop event
-            active = self._fire_event_thread('ordinance:plugin.stop', [qname])
+            active = self._fire_event_futures('ordinance:plugin.stop', [qname])
             if len(active):
                 ordinance.writer.debug(f"spawned {len(active)} threads for stop event.")
-                active = async_join_threads(active, timeout=5.0)
+                _, active = concurrent.futures.wait(active, timeout=5.0)
             if len(active):
                 ordinance.writer.info(f"Some threads did not finish within 5 seconds. Dropping.")
             ordinance.writer.info(f"Event plugin.stop done, closing.")
@@ -314,107 +511,146 @@ class Core:
             # deallocating the name; with setting to None, the name persists, but
             # the underlying object is still destroyed). regardless, from the gc's
             # perspective, this shouldn't leak. (hopefully.)
-            self.__plugins[qname]   = None
-            self.__schedules[qname] = None
-            self.__commands[qname]  = None
+            self.__unbucket_triggers(slot.instance)
+            self.__plugins[qname] = _PluginSlot()
     
 
     def is_known_plugin(self, qname: str) -> bool:
         return qname in self.__plugins
     
 
-    def _scheduler_loop(self, tick_interval: float, subtick_interval: float):
+    def _scheduler_loop(self, max_sleep: float):
         ordinance.writer.debug("Started scheduler thread.")
         localtz = core.schedule_interface.local_tz()
-        scheduler_start = datetime.datetime.now(tz=localtz)
-        granularity = tick_interval/2
-
-        last_tick_start = time.time()
-        while self._scheduler_should_run:
-            #ordinance.writer.debug("Doing scheduler subtick")
-            subtick_start = time.time()
-            time_since_last_tick = (subtick_start - last_tick_start)
-            if time_since_last_tick < tick_interval:
-                # not time for a full tick yet
-                time.sleep(subtick_interval)
-                continue
-            # time for scheduler tick! reset subtick
-            #ordinance.writer.debug("Doing scheduler tick")
-            last_tick_start = time.time()
-            
-            datetime_now = datetime.datetime.now(tz=localtz)
-            total_elapsed = datetime_now - scheduler_start
-            self.active_threads = [th for th in self.active_threads if th.is_alive()]
-
-            def calendar_filter(trigger):
-                return core.schedule_interface.calendar_trigger_should_run(
-                    trigger, datetime_now, granularity=granularity)
-
-            def delay_filter(trigger):
-                return core.schedule_interface.delay_trigger_should_run(
-                    trigger, total_elapsed, granularity=granularity)
-
-            def periodic_filter(trigger):
-                return core.schedule_interface.periodic_trigger_should_run(
-                    trigger, total_elapsed, granularity=granularity)
-            
-            # generator for all schedules
-            def sched_gen():
-                for plugin_name,scheduled_funcs in self.__schedules.items():
-                    if scheduled_funcs is None:
-                        continue  # plugin is unloaded
-                    plugin_instance = self.__plugins[plugin_name]
-                    for sched_name,sched in scheduled_funcs.items():
-                        yield (plugin_instance, sched)
+        # bound locally once, rather than resolved through module attributes
+        # on every fire
+        calnext = core.schedule_interface.calendar_next_fire
+        delnext = core.schedule_interface.delay_next_fire
+        pernext = core.schedule_interface.periodic_next_fire
+        reap = self.__reap_futures
+        spawn = self.__spawn
+        wake = self.__sched_wake
+        heappush, heappop = heapq.heappush, heapq.heappop
+        seq = itertools.count()  # heap tiebreaker, so triggers are never compared
+
+        # triggers sit in a heap keyed by when they are next due, and the
+        # scheduler sleeps until the earliest one. calendar triggers are due at
+        # a wall clock time (time.time()); delay and periodic triggers at a time
+        # since scheduler start, on the monotonic clock. entries are
+        # (due, seq, (plugin, sched, trigger), next-due function or None)
+        cal_heap = []
+        rel_heap = []
+        built_from = None
+        start_ns = time.monotonic_ns()
+        while True:
+            # (re)build the heaps whenever a plugin load/unload swapped buckets
+            buckets = (self.__triggers_calendar, self.__triggers_delay, self.__triggers_periodic)
+            if built_from is None or any(a is not b for a,b in zip(buckets, built_from)):
+                built_from = buckets
+                now_dt = datetime.datetime.now(tz=localtz)
+                elapsed = (time.monotonic_ns() - start_ns) / 1e9
+                cal_heap = [ (calnext(ent[2], now_dt).timestamp(), next(seq), ent, calnext) for ent in buckets[0] ]
+                rel_heap = [ (due, next(seq), ent, None) for ent in buckets[1]
+                             if (due := delnext(ent[2], elapsed)) is not None ]
+                rel_heap += [ (pernext(ent[2], elapsed), next(seq), ent, pernext) for ent in buckets[2] ]
+                heapq.heapify(cal_heap)
+                heapq.heapify(rel_heap)
             
-            # scheduled triggers
-            for plugin_instance,sched in sched_gen():
-                for trig in sched._get_triggers():
-                    if ( isinstance(trig, ordinance.schedule.CalendarTrigger) and calendar_filter(trig) ) \
-                    or ( isinstance(trig, ordinance.schedule.DelayTrigger)    and delay_filter(trig)    ) \
-                    or ( isinstance(trig, ordinance.schedule.PeriodicTrigger) and periodic_filter(trig) ) :
-                        ordinance.writer.debug(f"Firing trigger '{trig.id}', of sched '{sched.name}' on plugin '{plugin_instance.qname}', daemonic={trig.daemonic}")
-                        self.active_threads.append(sched(plugin_instance, trig.daemonic))
-            
-            tick_stop = time.time()
-            tick_elapsed = tick_stop - subtick_start
-            #ordinance.writer.debug(f"Finished scheduler tick. Took {tick_elapsed:.4f} seconds")
-            time.sleep(subtick_interval - tick_elapsed)
+            # sleep until the next trigger is due; stop() or a plugin load/unload
+            # wakes us up early. wall clock time can jump (or stall, across a
+            # suspend), so never sleep longer than `max_sleep` in one go
+            timeout = max_sleep
+            if cal_heap: timeout = min(timeout, cal_heap[0][0] - time.time())
+            if rel_heap: timeout = min(timeout, rel_heap[0][0] - (time.monotonic_ns() - start_ns) / 1e9)
+            if wake.wait(max(0.0, timeout)):
+                wake.clear()
+            if self._shutdown_evt.is_set():
+                break
+            reap()
+
+            # pop everything that is due, queueing up each trigger's next run
+            to_fire = []
+            if cal_heap:
+                now_ts = time.time()
+                if cal_heap[0][0] <= now_ts:
+                    now_dt = datetime.datetime.fromtimestamp(now_ts, tz=localtz)
+                    while cal_heap and cal_heap[0][0] <= now_ts:
+                        _, _, ent, nextfn = heappop(cal_heap)
+                        to_fire.append(ent)
+                        heappush(cal_heap, (nextfn(ent[2], now_dt).timestamp(), next(seq), ent, nextfn))
+            if rel_heap:
+                elapsed = (time.monotonic_ns() - start_ns) / 1e9
+                while rel_heap and rel_heap[0][0] <= elapsed:
+                    _, _, ent, nextfn = heappop(rel_heap)
+                    to_fire.append(ent)
+                    if nextfn is not None:
+                        heappush(rel_heap, (nextfn(ent[2], elapsed), next(seq), ent, nextfn))
+            if not to_fire: continue
+            # one log line (and one tracking pass) per batch, not per trigger
+            if ordinance.writer.is_debug_enabled():
+                ordinance.writer.debug(f"Firing batch of {len(to_fire)} triggers:",
+                    *(f"{plugin_instance.qname}.{sched.name}[{trig.id}]" for plugin_instance,sched,trig in to_fire))
+            self.__track_futures([ spawn(plugin_instance, sched, trig.daemonic) for plugin_instance,sched,trig in to_fire ])
         
         # teardown
-        ordinance.writer.debug(f"Scheduler noticed shutdown. Closing {len(self.active_threads)} active threads.")
-        if len(self.active_threads):
+        self.__reap_futures()
+        ordinance.writer.debug(f"Scheduler noticed shutdown. Closing {len(self.active_futures)} active threads.")
+        if len(self.active_futures):
             ordinance.writer.warn(f"Some threads still active. Joining with timeout 5s...")
-            self.active_threads = async_join_threads(self.active_threads, timeout=5.0)
+            _, not_done = concurrent.futures.wait(list(self.active_futures), timeout=5.0)
+            self.active_futures = not_done
         
-        if len(self.active_threads):
+        if len(self.active_futures):
             ordinance.writer.warn(f"Some threads did not finish within 5 seconds. Dropping.")
+        self.__pool.shutdown(wait=False, cancel_futures=True)
 
         ordinance.writer.info(f"Scheduler stopped.")
         ordinance.writer.debug("Stopped scheduler thread.")
 
 
-    def _fire_event_thread(self, event: str, plugins: Optional[List[str]] = ...) -> List[threading.Thread]:
+    def __spawn(self, plugin_instance: ordinance.plugin.OrdinancePlugin, sched: ordinance.schedule.ScheduledFunction, daemonic: bool) -> concurrent.futures.Future:
+        if not daemonic:
+            return self.__pool.submit(sched._run, plugin_instance)
+        # daemonic triggers must not hold up a pool worker (or shutdown), so
+        # these keep their own daemon thread, tracked through a bare future
+        fut = concurrent.futures.Future()
+        fut.set_running_or_notify_cancel()
+        sched(plugin_instance, True, on_done=lambda th: fut.set_result(None))
+        return fut
+
+
+    def __track_futures(self, futures: List[concurrent.futures.Future]) -> None:
+        # register before hooking the callback, which runs immediately if done
+        for fut in futures:
+            self.active_futures.add(fut)
+            fut.add_done_callback(self.__done_futures.append)
+
+
+    def __reap_futures(self) -> None:
+        done = self.__done_futures
+        while done:
+            self.active_futures.discard(done.popleft())
+
+
+    def _fire_event_futures(self, event: str, plugins: Optional[List[str]] = ...) -> List[concurrent.futures.Future]:
         ordinance.writer.info(f"Firing event {event} for {plugins}")
         active = []
-        if plugins is ...: plugins = self.__plugins.keys()
-        for plugin_name in plugins:
-            scheduled_funcs = self.__schedules[plugin_name]
-            if scheduled_funcs is None:
-                continue  # plugin was unloaded
-            plugin_instance = self.__plugins[plugin_name]
-            for sched in scheduled_funcs.values():
-                for trig in sched._get_triggers():
-                    if isinstance(trig, ordinance.schedule.EventTrigger) and trig.event == event:
-                        ordinance.writer.debug(f"Firing trigger '{trig.id}', of sched '{sched.name}', daemonic={trig.daemonic}")
-                        active.append(sched(plugin_instance, trig.daemonic))
+        subs = self.__event_index.get(event)
+        if not subs: return active
+        if plugins is not ...: plugins = set(plugins)
+        debug = ordinance.writer.is_debug_enabled()
+        for plugin_instance,sched,trig in subs:
+            if plugins is not ... and plugin_instance.qname not in plugins:
+                continue
+            if debug: ordinance.writer.debug(f"Firing trigger '{trig.id}', of sched '{sched.name}', daemonic={trig.daemonic}")
+            active.append(self.__spawn(plugin_instance, sched, trig.daemonic))
         return active
 
 
     def fire_event(self, event: str, plugins_list: Optional[List[str]] = ...) -> None:
         """ Note: :const:`...` for `plugins` will fire on all plugins. """
-        active = self._fire_event_thread(event, plugins_list)
-        self.active_threads.extend(active)
+        active = self._fire_event_futures(event, plugins_list)
+        self.__track_futures(active)
 
 
     def command(self, cmd: str) -> int:
@@ -447,10 +683,13 @@ class Core:
     # http api server stuffs
     
     def _apiserver_status_single_plugin(self, qname: str):
-        plugin = self.__plugins[qname]
-        sched_dict = self.__schedules[qname]
+        slot = self.__plugins[qname]
+        if not slot.loaded:
+            return { 'qname': qname, 'status': 'unloaded' }
+        plugin = slot.instance
         return {
             'qname': qname,
+            'status': 'running',
             'metadata': {
                 'name': plugin.name,
                 'description': plugin.description,
@@ -462,10 +701,10 @@ class Core:
                     'name': sched_name,
                     'triggers': [ {
                         'id': trig.id,
-                        'type': schedule_interface.get_type_string(trig),
+                        'type': core.schedule_interface.get_type_string(trig),
                         'data': trig.__dict__
                     } for trig in sched._get_triggers() ]
-                } for sched_name, sched in sched_dict.items()
+                } for sched_name, sched in slot.schedules.items()
             ],
             # 'commands': [
             #     #TODO
@@ -475,8 +714,8 @@ class Core:
     def _apiserver_plugins(self):
         return [ {
             'qname': qname,
-            'status': 'unloaded' if plugin is None else 'running'
-        } for qname,plugin in self.__plugins.items() ],
+            'status': 'running' if slot.loaded else 'unloaded'
+        } for qname,slot in self.__plugins.items() ]
     
     def _apiserver_writers(self):
         enabled = ordinance.writer.get_enabled()
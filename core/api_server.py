@@ -1,4 +1,5 @@
 import threading
+import concurrent.futures
 import http.server
 import json
 
@@ -6,62 +7,89 @@ import ordinance.writer
 
 from typing import Callable, Any, Optional, Tuple
 
+# orjson is optional; it encodes straight to bytes, and is much faster
+try: from orjson import dumps as _json_dumps
+except ImportError:
+    def _json_dumps(obj: Any) -> bytes: return json.dumps(obj).encode()
+
+_NOT_FOUND_PREFIX = b"Error 404\nUnknown API path '"
 
 class ApiRequestHandler(http.server.BaseHTTPRequestHandler):
     _core_ref = None
 
+    # exact-match routes, to the name of the Core method that serves them
+    _routes = {
+        "/status":        '_apiserver_status',
+        "/status/plugin": '_apiserver_plugins',
+        "/status/writer": '_apiserver_writers',
+    }
+    _plugin_prefix = "/status/plugin/"
+
     def send_json(self, obj: Any):
         self.send_response(200)
         self.send_header('Content-Type', 'application/json')
         self.end_headers()
-        dat = json.dumps(obj)
-        self.wfile.write(dat.encode() + b'\n')
+        dat = _json_dumps(obj)
+        self.wfile.write(dat + b'\n')
     
     def send_404(self, path: Optional[str] = ""):
         self.send_response(404)
         self.send_header('Content-Type', 'text/plain')
         self.end_headers()
         if not path: path = self.path
-        self.wfile.write(f"Error 404\nUnknown API path '{path}'".encode())
+        self.wfile.write(_NOT_FOUND_PREFIX + path.encode() + b"'")
 
     def do_GET(self):
         if self.path.endswith("/"): self.path = self.path[:-1]
+        core_ref = self.__class__._core_ref
         
-        if self.path == "/status":
-            self.send_json(self.__class__._core_ref._apiserver_status())
-        
-        elif self.path == "/status/plugin":
-            self.send_json(self.__class__._core_ref._apiserver_plugins())
+        route = self._routes.get(self.path)
+        if route is not None:
+            self.send_json(getattr(core_ref, route)())
         
-        elif self.path.startswith("/status/plugin/"):
-            qname = self.path[15:]
-            if not self.__class__._core_ref.is_known_plugin(qname):
+        elif self.path.startswith(self._plugin_prefix):
+            qname = self.path[len(self._plugin_prefix):]
+            if not core_ref.is_known_plugin(qname):
                 self.send_404()
             else:
-                self.send_json(self.__class__._core_ref._apiserver_status_single_plugin(qname))
-        
-        elif self.path == "/status/writer":
-            self.send_json(self.__class__._core_ref._apiserver_writers())
+                self.send_json(core_ref._apiserver_status_single_plugin(qname))
         
         else: self.send_404()
 
 
+class PooledHTTPServer(http.server.HTTPServer):
+    """ HTTPServer that handles each request on a bounded thread pool, instead of a fresh thread. """
+    def __init__(self, *args, pool: concurrent.futures.ThreadPoolExecutor, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.pool = pool
+
+    def process_request(self, request, client_address):
+        self.pool.submit(self._process_request_pooled, request, client_address)
+
+    def _process_request_pooled(self, request, client_address):
+        # same as socketserver.ThreadingMixIn.process_request_thread
+        try: self.finish_request(request, client_address)
+        except Exception: self.handle_error(request, client_address)
+        finally: self.shutdown_request(request)
+
+
 class ApiServerThread(threading.Thread):
-    def __init__(self, bind: Tuple[str, int], poll_interval: float = 1.0):
+    def __init__(self, bind: Tuple[str, int], poll_interval: float = 1.0, max_workers: int = 8):
         super().__init__(daemon=True, name="OrdinanceApiServer_Thread")
-        self.should_run = True
         self.bind = bind
-        self.server = http.server.ThreadingHTTPServer(
+        self.poll_interval = poll_interval
+        self.pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix='OrdApi')
+        self.server = PooledHTTPServer(
             bind,
-            ApiRequestHandler)
+            ApiRequestHandler,
+            pool=self.pool)
         self.address = ':'.join(str(c) for c in self.server.server_address)
-        self.server.timeout = poll_interval
-        self.server.daemon_threads = True
     
     def run(self):
         ordinance.writer.success(f"API server: online. Using {self.address}")
-        while self.should_run:
-            self.server.handle_request()
+        # blocks until ApiServer.stop() calls shutdown()
+        self.server.serve_forever(poll_interval=self.poll_interval)
 
 
 class ApiServer:
@@ -90,6 +118,8 @@ class ApiServer:
     def stop(self):
         with self.state_lock:
             if self.server is None: return
-            self.server.should_run = False
+            self.server.server.shutdown()
             self.server.join()
+            self.server.server.server_close()
+            self.server.pool.shutdown(wait=False, cancel_futures=True)
             self.server = None
@@ -1,33 +1,41 @@
 import ordinance.writer
 
-def add_known_writers():
-    try:
-        from .emailwriter import EmailWriter
-        ordinance.writer.add_writer_type('email', EmailWriter)
-    except Exception as e:
-        print("Failed to import EmailWriter: ", e)
+# imported once, at module load; a writer whose import fails is left as None
+#  and simply not registered
+try: from .emailwriter import EmailWriter
+except Exception as e:
+    EmailWriter = None
+    print("Failed to import EmailWriter: ", e)
+
+try: from .filewriter import FileWriter
+except Exception as e:
+    FileWriter = None
+    print("Failed to import FileWriter: ", e)
 
-    try:
-        from .filewriter import FileWriter
-        ordinance.writer.add_writer_type('logfile', FileWriter)
-    except Exception as e:
-        print("Failed to import FileWriter: ", e)
+try: from .notifwriter import NotifWriter
+except Exception as e:
+    NotifWriter = None
+    print("Failed to import NotifWriter: ", e)
 
-    try:
-        from .notifwriter import NotifWriter
-        ordinance.writer.add_writer_type('notif', NotifWriter)
-    except Exception as e:
-        print("Failed to import NotifWriter: ", e)
+try: from .stdoutwriter import StdoutWriter
+except Exception as e:
+    StdoutWriter = None
+    print("Failed to import StdoutWriter: ", e)
 
-    try:
-        from .stdoutwriter import StdoutWriter
-        ordinance.writer.add_writer_type('stdout', StdoutWriter)
-    except Exception as e:
-        print("Failed to import StdoutWriter: ", e)
+try: from .syslogwriter import SyslogWriter
+except Exception as e:
+    SyslogWriter = None
+    print("Failed to import SyslogWriter: ", e)
 
-    try:
-        from .syslogwriter import SyslogWriter
-        ordinance.writer.add_writer_type('syslog', SyslogWriter)
-    except Exception as e:
-        print("Failed to import SyslogWriter: ", e)
+_KNOWN_WRITERS = (
+    ('email', EmailWriter),
+    ('logfile', FileWriter),
+    ('notif', NotifWriter),
+    ('stdout', StdoutWriter),
+    ('syslog', SyslogWriter),
+)
 
+def add_known_writers():
+    for name, cls in _KNOWN_WRITERS:
+        if cls is not None:
+            ordinance.writer.add_writer_type(name, cls)
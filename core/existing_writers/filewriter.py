@@ -4,6 +4,7 @@ from typing import (
     Dict,
     List,
     Tuple,
+    Iterator,
     Any
 )
 
@@ -26,14 +27,8 @@ class FileWriter(WriterBase):
                 raise ordinance.exceptions.InvalidConfigValue("writers.logfile.files must be a list of { 'path': str, 'mask': int, 'strftime': str } objects")
             if 'strftime' not in obj:
                 obj['strftime'] = default_strftime
-        # ensure files exist
         self.paths: List[Tuple[str, int, str]] = []
         for obj in tmppaths:
-            path = os.path.abspath(obj['path'])
-            print(path)
-            if not os.path.isfile(path):
-                with open(obj['path'], 'w') as file:
-                    file.write('')
             self.paths.append( (obj['path'], obj['mask'], obj['strftime']) )
         # misc
         self.headers = {
@@ -45,13 +40,63 @@ class FileWriter(WriterBase):
             Message.CRIT:  "CRITICAL ",
             Message.ALRT:  "ALERT    ",
         }
+        self.headers_b = { k: (v + ' ').encode() for k,v in self.headers.items() }
+        # open (creating if needed) each file once, for the life of the writer.
+        # raw append-mode fds: each message is one os.write() per file, with no
+        # userspace buffering to flush
+        self._files: List[Tuple[int, int, str]] = []
+        try:
+            for (path,mask,strftime) in self.paths:
+                fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+                self._files.append( (fd, mask, strftime) )
+        except Exception:
+            self.close()
+            raise
+        # there are only a handful of importance levels, so resolve the masks
+        # up front into the exact destinations for each level. destinations
+        # are grouped by strftime, so each date format renders once per message
+        self._by_importance: Dict[int, List[Tuple[str, List[int]]]] = {}
+        for level in self.headers:
+            by_strftime: Dict[str, List[int]] = {}
+            for (fd,mask,strftime) in self._files:
+                if mask & level: by_strftime.setdefault(strftime, []).append(fd)
+            self._by_importance[level] = list(by_strftime.items())
 
-    def handle(self, msg: Message):
+    def _render(self, msg: Message) -> Iterator[Tuple[bytes, List[int]]]:
+        """ Yields each encoded line for the message, with the fds it goes to. """
         header = self.headers[msg.importance]
-        out = ' '.join(str(m) for m in msg.message)
-        for (path,mask,strftime) in self.paths:
-            if mask & msg.importance:
-                with open(path, 'a') as file:
-                    date = msg.time.strftime(strftime)
-                    out_to_file = out.replace('\n', f'\n{date} {header}')
-                    print(header, out_to_file, flush=True, file=file)
+        header_b = self.headers_b[msg.importance]
+        out = msg.text
+        # the date only appears on continuation lines; single-line messages
+        # are identical in every file, whatever its strftime
+        multiline = '\n' in out
+        if not multiline:
+            line = header_b + out.encode() + b'\n'
+        for (strftime,fds) in self._by_importance[msg.importance]:
+            if multiline:
+                date = msg.time.strftime(strftime)
+                out_to_file = out.replace('\n', f'\n{date} {header}')
+                line = header_b + out_to_file.encode() + b'\n'
+            yield (line, fds)
+
+    def handle(self, msg: Message):
+        for (line,fds) in self._render(msg):
+            for fd in fds:
+                os.write(fd, line)
+
+    def handle_batch(self, messages: List[Message]):
+        # gather the whole batch per file, then one os.write() each
+        pending: Dict[int, List[bytes]] = {}
+        for msg in messages:
+            for (line,fds) in self._render(msg):
+                for fd in fds:
+                    pending.setdefault(fd, []).append(line)
+        for fd,lines in pending.items():
+            os.write(fd, b''.join(lines))
+
+    def close(self):
+        with self._handle_lock:
+            for (fd,_,_) in self._files:
+                os.close(fd)
+            self._files = []
+            self._by_importance = { level: [] for level in self.headers }
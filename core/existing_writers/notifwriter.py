@@ -1,10 +1,11 @@
 import os
+import subprocess
 import collections
 import threading
-import asyncio
 
 from typing import (
     Dict,
+    List,
     Any
 )
 
@@ -25,22 +26,64 @@ except dbus.DBusException as e:
 
 class NotifWriter(WriterBase):
     """ Writer that shows a popup notification. """
+
+    # only these levels raise a notification; nothing else is sent here
+    accepted_mask = Message.ERRR | Message.ALRT | Message.CRIT
+    _titles = {
+        Message.ERRR: "Ordinance: Error",
+        Message.ALRT: "Ordinance: Alert",
+        Message.CRIT: "Ordinance: Critical",
+    }
+
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
         self.dbus_username = config.get('dbus_username')
         self.notify_send_path = config.get('notify_send_path', '/usr/bin/notify-send')
-    
-    def handle(self, msg: Message):
-        if   msg.importance & Message.ERRR: title = "Ordinance: Error"
-        elif msg.importance & Message.ALRT: title = "Ordinance: Alert"
-        elif msg.importance & Message.CRIT: title = "Ordinance: Critical"
-        else: return
-        body = ' '.join(str(s) for s in msg.message)
+        self.coalesce_window = config.get('coalesce_window', 0.2)
+        self.max_in_flight = config.get('max_in_flight', 8)
+        self._in_flight: collections.deque[subprocess.Popen] = collections.deque()
         # we have to use `sudo -u {user}`; reason, see comment block below
         # this is a hack and surely there's a better workaround, but idk
-        os.system(
-            f"sudo -u {self.dbus_username} -E DISPLAY=':0' {self.notify_send_path} " + \
-            f"-u 'critical' -a 'Ordinance Alerts' '{title}' '{body}'")
+        self._argv_prefix = [
+            "sudo", "-u", str(self.dbus_username), "-E", "DISPLAY=:0",
+            self.notify_send_path, "-u", "critical", "-a", "Ordinance Alerts"
+        ]
+    
+    def handle(self, msg: Message):
+        title = self._titles.get(msg.importance)
+        if title is None: return
+        self._notify(title, msg.text)
+
+    def handle_batch(self, messages: List[Message]):
+        # a burst of alerts becomes one popup per title rather than one each;
+        # coalesce_window has the drain thread wait for the rest of the burst
+        bodies: Dict[str, List[str]] = {}
+        for msg in messages:
+            title = self._titles.get(msg.importance)
+            if title is not None: bodies.setdefault(title, []).append(msg.text)
+        for title,group in bodies.items():
+            self._notify(title, '\n'.join(group))
+
+    def _notify(self, title: str, body: str):
+        # up to max_in_flight notify-sends run at once; past that, wait on the
+        # oldest. finished ones are reaped here, so none are left as zombies
+        in_flight = self._in_flight
+        while in_flight and in_flight[0].poll() is not None: in_flight.popleft()
+        if len(in_flight) >= self.max_in_flight:
+            try: in_flight.popleft().wait(timeout=10)
+            except subprocess.TimeoutExpired: pass
+        # no shell, so the message can't break out of its argument
+        try:
+            in_flight.append(subprocess.Popen(self._argv_prefix + [title, body],
+                stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL))
+        except OSError as e:
+            print("NotifWriter: Failed to run notify-send: ", e)
+
+    def close(self):
+        for proc in self._in_flight:
+            try: proc.wait(timeout=1)
+            except subprocess.TimeoutExpired: pass
+        self._in_flight.clear()
 
 # NOTE -- this version uses asyncio and python-dbus, but doesn't work because
 #         root can't connect to a given user's dbus session
@@ -60,7 +103,7 @@ class NotifWriter(WriterBase):
         elif msg.importance & Message.ALRT: title = "Ordinance: Alert"
         elif msg.importance & Message.CRIT: title = "Ordinance: Critical"
         else: return
-        body = ' '.join(str(s) for s in msg.message)
+        body = msg.text
         self.queue.append((title,body))
     
     def run(self):
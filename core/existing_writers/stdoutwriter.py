@@ -1,7 +1,6 @@
-from typing import (
-    Dict,
-    Any
-)
+import sys
+
+from typing import List
 
 import ordinance.exceptions
 from ordinance.writer import WriterBase, Message
@@ -17,22 +16,41 @@ class colors:
     CYAN   = "\033[36m"
     WHITE  = "\033[37m"
 
+# importance levels are single bits, so these are indexed by
+# `importance.bit_length() - 1`, in the order DBUG, INFO, ..., ALRT
+_HEADERS = (
+            "\033[35m[DBUG]\033[0m ",
+            "\033[34m[INFO]\033[0m ",
+            "\033[32m[SUCC]\033[0m ",
+            "\033[33m[WARN]\033[0m ",
+            "\033[31m[ERRR]\033[0m ",
+    "\033[37m\033[41m[CRIT]\033[0m ",
+    "\033[37m\033[41m[ALRT]\033[0m ",
+)
+# what starts each line, for the first line and for continuations
+_PREFIX  = tuple(hdr + ' '        for hdr in _HEADERS)
+_NL_REPL = tuple('\n' + hdr + ' ' for hdr in _HEADERS)
+
 class StdoutWriter(WriterBase):
     """ Writer that writes to stdout. """
-    def __init__(self, config: Dict[str, Any]):
-        super().__init__(config)
-        self.headers = {
-            Message.DBUG:          "\033[35m[DBUG]\033[0m ",
-            Message.INFO:          "\033[34m[INFO]\033[0m ",
-            Message.SUCC:          "\033[32m[SUCC]\033[0m ",
-            Message.WARN:          "\033[33m[WARN]\033[0m ",
-            Message.ERRR:          "\033[31m[ERRR]\033[0m ",
-            Message.CRIT:  "\033[37m\033[41m[CRIT]\033[0m ",
-            Message.ALRT:  "\033[37m\033[41m[ALRT]\033[0m ",
-        }
+    def _format(self, msg: Message) -> str:
+        i = msg.importance.bit_length() - 1
+        out = msg.text
+        if '\n' in out: out = out.replace('\n', _NL_REPL[i])
+        return _PREFIX[i] + out + '\n'
 
     def handle(self, msg: Message):
-        header = self.headers[msg.importance]
-        out = ' '.join(str(m) for m in msg.message)
-        out = out.replace('\n', f'\n{header} ')
-        print(header, out, flush=True)
+        self.handle_batch([msg])
+
+    def handle_batch(self, messages: List[Message]):
+        # everything drained at once goes out in a single write() to the raw
+        # stdout buffer, rather than one write and flush per line
+        data = ''.join([self._format(msg) for msg in messages])
+        out = sys.stdout
+        raw = getattr(out, 'buffer', None)
+        if raw is None:
+            out.write(data); out.flush()
+            return
+        out.flush()  # anything print()ed before this batch goes out first
+        raw.write(data.encode(out.encoding or 'utf-8', 'replace'))
+        raw.flush()
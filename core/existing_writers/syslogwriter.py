@@ -1,27 +1,41 @@
 from systemd import journal
 
-from typing import (
-    Dict,
-    Any
-)
+from typing import List
 
 import ordinance.exceptions
 from ordinance.writer import WriterBase, Message
 
+# journal priority per importance level, indexed by `importance.bit_length() - 1`
+_PRIO = (
+    journal.LOG_INFO,     # DBUG
+    journal.LOG_INFO,     # INFO
+    journal.LOG_NOTICE,   # SUCC
+    journal.LOG_WARNING,  # WARN
+    journal.LOG_ERR,      # ERRR
+    journal.LOG_CRIT,     # CRIT
+    journal.LOG_ALERT,    # ALRT
+)
+
 class SyslogWriter(WriterBase):
     """ Writer that writes to syslog. """
-    def __init__(self, config: Dict[str, Any]):
-        super().__init__(config)
-        self.importances = {
-            Message.DBUG:  journal.LOG_INFO,
-            Message.INFO:  journal.LOG_INFO,
-            Message.SUCC:  journal.LOG_NOTICE,
-            Message.WARN:  journal.LOG_WARNING,
-            Message.ERRR:  journal.LOG_ERR,
-            Message.CRIT:  journal.LOG_CRIT,
-            Message.ALRT:  journal.LOG_ALERT,
-        }
-
     def handle(self, msg: Message):
-        out = ' '.join(str(m) for m in msg.message)
-        journal.send(out, PRIORITY=self.importances[msg.importance])
+        out = msg.text
+        journal.send(out, PRIORITY=_PRIO[msg.importance.bit_length() - 1])
+
+    def handle_batch(self, messages: List[Message]):
+        # consecutive messages of the same priority go out as one journal entry;
+        # only runs are merged, so ordering is kept. critical and alert
+        # messages are rare, and always get an entry of their own
+        run: List[str] = []
+        run_prio = None
+        for msg in messages:
+            prio = _PRIO[msg.importance.bit_length() - 1]
+            if msg.importance & (Message.CRIT | Message.ALRT):
+                if run: journal.send('\n'.join(run), PRIORITY=run_prio); run = []
+                journal.send(msg.text, PRIORITY=prio)
+                continue
+            if run and prio != run_prio:
+                journal.send('\n'.join(run), PRIORITY=run_prio); run = []
+            run_prio = prio
+            run.append(msg.text)
+        if run: journal.send('\n'.join(run), PRIORITY=run_prio)
@@ -22,15 +22,15 @@ def read_dbs():
 def setup_iptables() -> bool:
     ordinance.writer.debug(f"Flushing iptables chain and creating a new one...")
 
+    # each group runs as a single shell, rather than one shell per command
     can_fail_commands = [
         "iptables -D INPUT -j ORDINANCE",
         "iptables -D ORDINANCE -m set --match-set ORDINANCE_BLACKLIST src -j DROP",
-        "ipset destroy ORDINANCE_BLACKLIST"
+        "ipset destroy ORDINANCE_BLACKLIST",
         "iptables --delete-chain ORDINANCE",
     ]
-    for cmd in can_fail_commands:
-        code,stdout = subprocess.getstatusoutput(cmd)
-        #if code: pass
+    subprocess.run(['sh', '-c', '; '.join(can_fail_commands) + '; true'],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
     
     must_succeed_commands = [
         "iptables -N ORDINANCE",
@@ -38,12 +38,12 @@ def setup_iptables() -> bool:
         "iptables -I INPUT -j ORDINANCE",
         "ipset create ORDINANCE_BLACKLIST hash:ip"
     ]
-    for cmd in must_succeed_commands:
-        code,stdout = subprocess.getstatusoutput(cmd)
-        if code:
-            ordinance.writer.error(f"Could not setup IPtables, code {code}, with error:")
-            ordinance.writer.error(stdout)
-            return False
+    proc = subprocess.run(['sh', '-c', ' && '.join(must_succeed_commands)],
+        stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+    if proc.returncode:
+        ordinance.writer.error(f"Could not setup IPtables, code {proc.returncode}, with error:")
+        ordinance.writer.error(proc.stdout.rstrip('\n'))
+        return False
     
     ordinance.writer.info(f"Successfully setup IPtables")
     return True
@@ -1,35 +1,39 @@
 import os
 import sys
-import yaml
-import yaml.parser
+import copy
+import marshal
+import struct
+import functools
 import importlib.util
-import datetime
-import time
+import pkgutil
 
 import ordinance.schedule
 import ordinance.exceptions
 import ordinance.plugin
 import ordinance.writer
 
-from typing import Set, Tuple, Dict, Any
-
+from typing import Set, Tuple, Dict, Optional, Any
 
 valid_qname_chars = "abcdefghijklmnopqrstuvwxyz0123456789.-_+"
+_valid_qname_set = frozenset(valid_qname_chars)
 
 recognized_metadata_keys = ['name', 'author', 'description', 'version']
 
 def deep_merge(dict1: dict, dict2: dict) -> dict:
     """
-    Merges two dicts. If keys are conflicting, dict2 is preferred.
-    
-    Credit to milanboers on GitHub for this function:
-    https://gist.github.com/milanboers/a8bb8b81b1c3fb3eb86ee2d9ea4bd5b2
+    Merges two dicts. If keys are conflicting, dict2 is preferred. A value of
+    None in dict2 (a key left blank in the yaml) does not override dict1, but
+    other falsy values like 0, False or "" do.
     """
-    def _val(v1, v2):
+    out = dict(dict1)
+    for k,v2 in dict2.items():
+        if v2 is None and k in out: continue
+        v1 = out.get(k)
         if isinstance(v1, dict) and isinstance(v2, dict):
-            return deep_merge(v1, v2)
-        return v2 or v1
-    return {k: _val(dict1.get(k), dict2.get(k)) for k in dict1.keys() | dict2.keys()}
+            out[k] = deep_merge(v1, v2)
+        else:
+            out[k] = v2
+    return out
 
 
 def fetch_all_qnames() -> Set[str]:
@@ -42,7 +46,7 @@ def fetch_all_qnames() -> Set[str]:
     for fname in os.listdir(path):
         if fname == 'disabled':
             ordinance.writer.debug(f"'disabled' folder found, skipping it.")
-        elif not all(c in valid_qname_chars for c in fname):
+        elif not _valid_qname_set.issuperset(fname):
             ordinance.writer.warn(f"Skipping bad plugin qname '{fname}'. Plugin qnames can only contain " +
                                    "lowercase a-z, 0-9, and any characters from [+-_] (not including the brackets).")
         elif fname in valid_qnames:
@@ -56,15 +60,63 @@ def fetch_all_qnames() -> Set[str]:
 # module load stages
 
 
+# parsed plugin.yaml files, keyed by qname, as ((mtime_ns, size), conf). callers
+# get a deep copy, since the default config ends up handed to the plugin
+_plugin_yaml_cache: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
+# parsed plugin.yaml files are also written next to the yaml with marshal, which
+# is far cheaper to load on the next start. the header holds the yaml's mtime
+# and size, plus the marshal version, so a stale sidecar is never used
+_yaml_sidecar_header = struct.Struct('<qqi')
+
+def _read_yaml_sidecar(sidecar_path: str, key: Tuple[int, int]) -> Optional[Dict[str, Any]]:
+    """ Returns the parse cached in the sidecar, or None if it is missing or stale. """
+    try:
+        with open(sidecar_path, 'rb') as file:
+            dat = file.read()
+        if _yaml_sidecar_header.unpack_from(dat) != (*key, marshal.version):
+            return None
+        conf = marshal.loads(memoryview(dat)[_yaml_sidecar_header.size:])
+    except (OSError, ValueError, EOFError, TypeError, struct.error):
+        return None
+    return conf if isinstance(conf, dict) else None
+
+def _write_yaml_sidecar(sidecar_path: str, key: Tuple[int, int], conf: Dict[str, Any]) -> None:
+    """ Writes the marshal sidecar for this plugin.yaml, if marshal can represent it. """
+    try:
+        dat = _yaml_sidecar_header.pack(*key, marshal.version) + marshal.dumps(conf)
+        tmp_path = f"{sidecar_path}.tmp"
+        with open(tmp_path, 'wb') as file:
+            file.write(dat)
+        os.replace(tmp_path, sidecar_path)
+    except (OSError, ValueError):
+        pass  # the sidecar is only an optimization
+
 def load_plugin_yaml(qname: str) -> Tuple[str, Dict[str, str], Dict[str, Any]]:
-    # try loading the plugin.yaml config file
+    # try loading the plugin.yaml config file, unless it's unchanged since the
+    # last time it was parsed
+    path = f"extensions/{qname}/plugin.yaml"
     try:
-        with open(f"extensions/{qname}/plugin.yaml", 'r') as file:
-            conf = yaml.safe_load(file.read())
+        st = os.stat(path)
+        key = (st.st_mtime_ns, st.st_size)
+        cached = _plugin_yaml_cache.get(qname)
+        if cached is not None and cached[0] == key:
+            conf = copy.deepcopy(cached[1])
+        else:
+            sidecar_path = f"{path}.cache"
+            conf = _read_yaml_sidecar(sidecar_path, key)
+            if conf is None:
+                import yaml  # only needed when there's no up-to-date sidecar
+                with open(path, 'rb') as file:
+                    try: conf = yaml.load(file, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
+                    except yaml.YAMLError:
+                        raise ordinance.exceptions.PluginInvalid(f"Plugin {qname}/plugin.yaml is invalid YAML")
+                if isinstance(conf, dict):
+                    _write_yaml_sidecar(sidecar_path, key, conf)
+            if isinstance(conf, dict):
+                _plugin_yaml_cache[qname] = (key, copy.deepcopy(conf))
     except FileNotFoundError:
         raise ordinance.exceptions.PluginInvalid(f'Plugin {qname} has no plugin.yaml')
-    except yaml.parser.ParserError:
-        raise ordinance.exceptions.PluginInvalid(f"Plugin {qname}/plugin.yaml is invalid YAML")
     # ensure there's an entry point defined
     if "entry_file" not in conf:
         raise ordinance.exceptions.PluginNoDefinedEntryPointError(qname)
@@ -81,11 +133,29 @@ def load_plugin_yaml(qname: str) -> Tuple[str, Dict[str, str], Dict[str, Any]]:
     return (entry_file, meta, default_conf)
 
 
+@functools.lru_cache(maxsize=256)
+def _resolve_entry_name(qname: str, entry_file: str) -> str:
+    # the same (qname, entry_file) pairs come up again on every reload
+    return importlib.util.resolve_name(f"extensions.{qname}.{entry_file}", None)
+
 def load_module_from_file(qname: str, entry_file: str):
     # resolve module name
     try:
-        resolved_name = importlib.util.resolve_name(f"extensions.{qname}.{entry_file}", None)
-        spec = importlib.util.find_spec(resolved_name)
+        resolved_name = _resolve_entry_name(qname, entry_file)
+        # already imported (and not since unloaded)? skip the finder walk. the
+        # spec name is checked, since a qname can shadow an unrelated module
+        module = sys.modules.get(qname)
+        spec = getattr(module, '__spec__', None)
+        if spec is not None and spec.name == resolved_name:
+            return module
+        # ask the plugin folder's own finder directly; get_importer caches it
+        # in sys.path_importer_cache, so it's reused across loads and reloads
+        # instead of walking sys.meta_path and the parent packages each time
+        finder = None
+        if '.' not in entry_file:
+            finder = pkgutil.get_importer(os.path.abspath(f"extensions/{qname}"))
+        if finder is not None: spec = finder.find_spec(resolved_name)
+        else: spec = importlib.util.find_spec(resolved_name)
         module = importlib.util.module_from_spec(spec)
     except Exception as e:
         raise ordinance.exceptions.PluginLoadingFailed(f"Could not load plugin {qname}, error extracting module:", e=e)
@@ -131,22 +201,14 @@ def write_metadata(plugin_cls: type, qname: str, meta: Dict[str, str]) -> None:
         setattr(plugin_cls, key, val)
 
 
+# both are collected by OrdinancePlugin.__init_subclass__ when the class is defined
+
 def extract_scheduler_funcs(plugin_cls: type) -> Dict[str, Any]:
-    schedules = {}
-    for name,method in plugin_cls.__dict__.items():
-        if isinstance(method, ordinance.schedule.ScheduledFunction):
-            if name in schedules:
-                ordinance.writer.warn(f"Duplicate scheduled method name {name} on plugin")
-            schedules[name] = method
-    return schedules
+    return plugin_cls.__schedules__
 
 
 def extract_command_funcs(plugin_cls: type) -> Dict[str, Any]:
-    commands = {}
-    for name,method in plugin_cls.__dict__.items():
-        if hasattr(method, '__ordinance_commands'):
-            commands[name] = method.__ordinance_commands
-    return commands
+    return plugin_cls.__commands__
 
 
 # module teardown functions
@@ -2,9 +2,10 @@ import threading
 import datetime
 import time
 
-from typing import List, Dict
+from typing import List, Dict, Optional
 
 import ordinance.writer
+import ordinance.schedule
 
 # helper methods
 
@@ -16,33 +17,45 @@ def local_tz() -> datetime.timezone:
     if time.daylight:  return datetime.timezone(datetime.timedelta(seconds=-time.altzone),  time.tzname[1])
     else:              return datetime.timezone(datetime.timedelta(seconds=-time.timezone), time.tzname[0])
 
-def get_type_string(trigger: ordinance.schedule.BaseTrigger):
-    if   isinstance(trigger, ordinance.schedule.CalendarTrigger): return 'calendar'
-    elif isinstance(trigger, ordinance.schedule.DelayTrigger):    return 'delay'
-    elif isinstance(trigger, ordinance.schedule.EventTrigger):    return 'event',
-    elif isinstance(trigger, ordinance.schedule.PeriodicTrigger): return 'periodic'
-    return 'none'
+_TRIGGER_TYPES = {
+    ordinance.schedule.CalendarTrigger: 'calendar',
+    ordinance.schedule.DelayTrigger:    'delay',
+    ordinance.schedule.EventTrigger:    'event',
+    ordinance.schedule.PeriodicTrigger: 'periodic',
+}
 
+def get_type_string(trigger: ordinance.schedule.BaseTrigger) -> str:
+    return _TRIGGER_TYPES.get(type(trigger), 'none')
 
 
-# trigger should_run functions
 
-def calendar_trigger_should_run(calendar_trigger: ordinance.schedule.CalendarTrigger, now: datetime.datetime, granularity: float = 0.0) -> bool:
-    if calendar_trigger.align_to == 'month':
-        period_start = datetime.datetime(now.year, now.month, 0)
-    elif calendar_trigger.align_to == 'week':
-        period_start = datetime.datetime(now.year, now.month, now.day - now.weekday())
-    elif calendar_trigger.align_to == 'day':
-        period_start = datetime.datetime(now.year, now.month, now.day)
-    run = period_start + datetime.timedelta(seconds=calendar_trigger.seconds_into)
-    delta = run - now
-    return abs(delta.total_seconds()) <= granularity
-
-def delay_trigger_should_run(delay_trigger: ordinance.schedule.DelayTrigger, total_elapsed: datetime.timedelta, granularity: float = 0.0) -> bool:
-    d = datetime.timedelta(seconds=delay_trigger.delay_sec)
-    return abs( (total_elapsed - d).total_seconds() ) <= granularity
-
-def periodic_trigger_should_run(periodic_trigger: ordinance.schedule.PeriodicTrigger, total_elapsed: datetime.timedelta, granularity: float = 0.0) -> bool:
-    sec_left = total_elapsed.total_seconds() % periodic_trigger.period_sec
-    return abs(sec_left) <= granularity
+# trigger next-fire functions
 
+def calendar_next_fire(calendar_trigger: ordinance.schedule.CalendarTrigger, now: datetime.datetime) -> datetime.datetime:
+    """ Returns the first wall clock time strictly after `now` that this trigger is due. """
+    midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    into = datetime.timedelta(seconds=calendar_trigger.seconds_into)
+    if calendar_trigger.align_to == 'day':
+        run = midnight + into
+        if run <= now: run += datetime.timedelta(days=1)
+    elif calendar_trigger.align_to == 'week':
+        run = midnight - datetime.timedelta(days=now.weekday()) + into
+        if run <= now: run += datetime.timedelta(weeks=1)
+    else:  # month
+        month_start = midnight.replace(day=1)
+        run = month_start + into
+        if run <= now:
+            month_start = (month_start + datetime.timedelta(days=32)).replace(day=1)
+            run = month_start + into
+    return run
+
+def delay_next_fire(delay_trigger: ordinance.schedule.DelayTrigger, total_elapsed: float) -> Optional[float]:
+    """ Returns the elapsed time this one-shot trigger is due at, or None if that has passed. """
+    if delay_trigger.delay_sec > total_elapsed:
+        return delay_trigger.delay_sec
+    return None
+
+def periodic_next_fire(periodic_trigger: ordinance.schedule.PeriodicTrigger, total_elapsed: float) -> float:
+    """ Returns the first elapsed time strictly after `total_elapsed` that this trigger is due. """
+    period = periodic_trigger.period_sec
+    return (total_elapsed // period + 1) * period
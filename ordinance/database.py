@@ -1,16 +1,34 @@
 import threading
+import struct
+import mmap
 import json
 import os
 import io
 
 from os import PathLike
-from typing import Dict, Tuple, Set, Union, Optional, Any
+from typing import Dict, Tuple, Set, Union, Optional, Iterable, Any
 
 
 
 # module globals
 
 LOCAL_DATABASE_HEADER = b"Ordinance local data storage file. Do not edit, or the data will be corrupted.\n---\n"
+LOCAL_DATABASE_HEADER_LEN = len(LOCAL_DATABASE_HEADER)
+
+# precompiled big-endian unsigned ints, for the fixed-width fields in the
+# (de)serializers below
+_U8  = struct.Struct('>B')
+_U16 = struct.Struct('>H')
+_U32 = struct.Struct('>I')
+_U64 = struct.Struct('>Q')
+
+def _read_count_at(buf: mmap.mmap, off: int) -> Tuple[int, int]:
+    """
+    Reads the leading entry count at `off`, returning (count, new offset). A
+    file holding only the header is empty.
+    """
+    if off == len(buf): return (0, off)
+    return (_U64.unpack_from(buf, off)[0], off + 8)
 
 def parse_path(path: str) -> str:
     # ensure path is to a good file
@@ -25,14 +43,62 @@ def parse_path(path: str) -> str:
     return path
 
 
+class _RWLock:
+    """
+    Lets any number of readers in at once, or a single writer. A waiting writer
+    holds off new readers, so a steady stream of reads can't starve it. Use as
+    `with lock.read:` and `with lock.write:`.
+    """
+    def __init__(self):
+        self._cond = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writing = False
+        self._writers_waiting = 0
+        self.read  = _RWLockGuard(self.acquire_read,  self.release_read)
+        self.write = _RWLockGuard(self.acquire_write, self.release_write)
+
+    def acquire_read(self):
+        with self._cond:
+            while self._writing or self._writers_waiting:
+                self._cond.wait()
+            self._readers += 1
+
+    def release_read(self):
+        with self._cond:
+            self._readers -= 1
+            if not self._readers: self._cond.notify_all()
+
+    def acquire_write(self):
+        with self._cond:
+            self._writers_waiting += 1
+            while self._writing or self._readers:
+                self._cond.wait()
+            self._writers_waiting -= 1
+            self._writing = True
+
+    def release_write(self):
+        with self._cond:
+            self._writing = False
+            self._cond.notify_all()
+
+class _RWLockGuard:
+    __slots__ = ('_acquire', '_release')
+    def __init__(self, acquire, release):
+        self._acquire = acquire
+        self._release = release
+    def __enter__(self): self._acquire()
+    def __exit__(self, *exc): self._release()
+
 # base classes
 
 class BaseKeyValDatabase:
     def __init__(self, path: str, name: Optional[str] = ""):
         self.__db: Dict[str, Any] = {}
         self.__name = name
-        self.__lock = threading.Lock()
+        self.__rwlock = _RWLock()
         self.__path = parse_path(path)
+        # bound once, rather than looked up through the class on every call
+        self._vt = self._value_type
     
     @property
     def name(self) -> str: return self.__name
@@ -40,52 +106,54 @@ class BaseKeyValDatabase:
     # helper functions
     
     def __contains__(self, key: str) -> bool:
-        try: value = self._value_type(value)
-        except ValueError: raise TypeError("Value could not be type-casted to match database type")    
-        with self.__lock:
+        if not isinstance(key, str): raise TypeError("Key must be a str")
+        with self.__rwlock.read:
             return key in self.__db
     
     def __len__(self) -> int:
-        with self.__lock:
+        with self.__rwlock.read:
             return len(self.__db)
     
+    # iterators run over a snapshot taken under the lock, so a slow consumer
+    # never holds the lock against writers
+
     def items(self):
-        with self.__lock:
-            for item in self.__db.items(): yield item
+        with self.__rwlock.read: snap = tuple(self.__db.items())
+        return iter(snap)
     
     def keys(self):
-        with self.__lock:
-            for key in self.__db.keys(): yield key
+        with self.__rwlock.read: snap = tuple(self.__db)
+        return iter(snap)
     
     def values(self):
-        with self.__lock:
-            for value in self.__db.values(): yield value
+        with self.__rwlock.read: snap = tuple(self.__db.values())
+        return iter(snap)
     
     def get(self, key: str, default: Optional[Any] = ...) -> Any:
         if not isinstance(key, str): raise TypeError("Key must be a str")
-        with self.__lock:
+        with self.__rwlock.read:
             if key in self.__db: return self.__db[key]           # key found! return it
         if default is ...: raise KeyError(f"Unknown key {key}")  # key not found and default not specified
-        try: return self._value_type(default)                    # key not found and default specified; type-cast default
+        try: return self._vt(default)                            # key not found and default specified; type-cast default
         except ValueError: raise TypeError("Default could not be type-casted to match database value type")
 
     def set(self, key: str, value: Any) -> None:
         if not isinstance(key, str): raise TypeError("Key must be a str")
-        with self.__lock:
-            try: self.__db[key] = self._value_type(value)
+        with self.__rwlock.write:
+            try: self.__db[key] = self._vt(value)
             except ValueError: raise TypeError("Value could not be type-casted to match database type")
     
     def delete(self, key: str) -> None:
         if not isinstance(key, str): raise TypeError("Key must be a str")
-        with self.__lock: del self.__db[key]
+        with self.__rwlock.write: del self.__db[key]
     
     def clear(self) -> None:
-        with self.__lock:  self.__db = {}
+        with self.__rwlock.write:  self.__db = {}
     
     # file io wrappers
 
     def flush(self):
-        with self.__lock:
+        with self.__rwlock.write:
             with open(self.__path, 'wb') as file:
                 file.write(LOCAL_DATABASE_HEADER)
                 self._serialize(file, self.__db)
@@ -98,13 +166,16 @@ class BaseKeyValDatabase:
             else:
                 raise FileNotFoundError(self.__path)
             return
-        with self.__lock:
+        with self.__rwlock.write:
             with open(self.__path, 'rb') as file:
                 # check header
-                data = file.read(len(LOCAL_DATABASE_HEADER))
+                data = file.read(LOCAL_DATABASE_HEADER_LEN)
                 if data != LOCAL_DATABASE_HEADER:
                     raise OSError(f"Database file '{self.__path}' is corrupted!")
-                self.__db = self._deserialize(file)
+                # map the file once, and let the deserializer walk it in place
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                    try: self.__db = self._deserialize_buffer(buf, LOCAL_DATABASE_HEADER_LEN)
+                    except struct.error: raise ValueError(f"Database file '{self.__path}' is truncated")
 
     # functions that must be defined by inherited classes
 
@@ -112,12 +183,21 @@ class BaseKeyValDatabase:
     def _deserialize(self, file: io.BufferedReader) ->    Dict[str, Any]:           raise NotImplementedError()
     def _value_type( self, value: Any) -> Any:                                      raise NotImplementedError()
 
+    def _deserialize_buffer(self, buf: mmap.mmap, offset: int) -> Dict[str, Any]:
+        """
+        Deserializes straight from the mapped file, starting at `offset`. By
+        default this hands a copy to `_deserialize`; override it to skip that.
+        """
+        return self._deserialize(io.BytesIO(buf[offset:]))
+
 class BaseDataset:
     def __init__(self, path: str, name: Optional[str] = ""):
         self.__db: Set[Any] = set()
         self.__name = name
         self.__lock = threading.Lock()
         self.__path = parse_path(path)
+        # bound once, rather than looked up through the class on every call
+        self._vt = self._value_type
     
     @property
     def name(self) -> str: return self.__name
@@ -125,7 +205,7 @@ class BaseDataset:
     # builtin functions
     
     def __contains__(self, value: Any) -> bool:
-        try: value = self._value_type(value)
+        try: value = self._vt(value)
         except ValueError: raise TypeError("Value could not be type-casted to match database type")    
         with self.__lock:
             return value in self.__db
@@ -137,27 +217,41 @@ class BaseDataset:
     # helper functions
     
     def iter(self):
-        with self.__lock:
-            for item in self.__db: yield item
+        # iterates a snapshot, so a slow consumer never holds the lock
+        with self.__lock: snap = tuple(self.__db)
+        return iter(snap)
     
     def add(self, value: Any) -> None:
-        try: value = self._value_type(value)
+        try: value = self._vt(value)
         except ValueError: raise TypeError("Value could not be type-casted to match database type")
         with self.__lock:
             self.__db.add(value)
     
     def delete(self, value: Any) -> None:
-        try: value = self._value_type(value)
+        try: value = self._vt(value)
         except ValueError: raise TypeError("Value could not be type-casted to match database type")
         with self.__lock:
             self.__db.remove(value)
     
+    def add_many(self, values: Iterable[Any]) -> None:
+        """ Adds every value, taking the lock once for the whole batch. """
+        typed = self.__typed(values)
+        with self.__lock:
+            self.__db |= typed
+    
+    def delete_many(self, values: Iterable[Any]) -> None:
+        """
+        Removes every value, taking the lock once for the whole batch. If any
+        of them are missing, raises KeyError and removes none.
+        """
+        typed = self.__typed(values)
+        with self.__lock:
+            missing = typed - self.__db
+            if missing: raise KeyError(next(iter(missing)))
+            self.__db -= typed
+    
     def update_to(self, values: set) -> None:
-        typed = set()
-        for value in values:
-            try: value = self._value_type(value)
-            except ValueError: raise TypeError("Value could not be type-casted to match database type")
-            else: typed.add(value)
+        typed = self.__typed(values)
         with self.__lock:
             self.__db = typed
     
@@ -167,29 +261,27 @@ class BaseDataset:
     
     # standard set operations
     
+    def __typed(self, values) -> set:
+        # casting happens outside the lock; only the set op itself holds it
+        vt = self._vt
+        try: return {vt(value) for value in values}
+        except ValueError: raise TypeError("Value could not be type-casted to match database type")
+    
     def intersection(self, other: set) -> set:
         """
         Returns a set containing all items in BOTH this set and set `other`.
         """
-        typed = set()
+        typed = self.__typed(other)
         with self.__lock:
-            for value in other:
-                try: value = self._value_type(value)
-                except ValueError: raise TypeError("Value could not be type-casted to match database type")
-                if value in self.__db: typed.add(value)
-        return typed
+            return typed & self.__db
     
     def union(self, other: set) -> set:
         """
         Returns a set containing all items in EITHER this set or set `other`.
         """
-        typed = set()
+        typed = self.__typed(other)
         with self.__lock:
-            for value in other:
-                try: value = self._value_type(value)
-                except ValueError: raise TypeError("Value could not be type-casted to match database type")
-                typed.add(value)
-            return typed + self.__db
+            return typed | self.__db
     
     def diff(self, other: set) -> Tuple[set, set]:
         """
@@ -197,11 +289,7 @@ class BaseDataset:
             a   is items that are unique to set `other`, and
             b   is items that are unique to this set.
         """
-        typed = set()
-        for value in other:
-            try: value = self._value_type(value)
-            except ValueError: raise TypeError("Value could not be type-casted to match database type")
-            else: typed.add(value)
+        typed = self.__typed(other)
         with self.__lock:
             return (typed - self.__db, self.__db - typed)
     
@@ -224,10 +312,13 @@ class BaseDataset:
         with self.__lock:
             with open(self.__path, 'rb') as file:
                 # check header
-                data = file.read(len(LOCAL_DATABASE_HEADER))
+                data = file.read(LOCAL_DATABASE_HEADER_LEN)
                 if data != LOCAL_DATABASE_HEADER:
                     raise OSError(f"Database file '{self.__path}' is corrupted!")
-                self.__db = self._deserialize(file)
+                # map the file once, and let the deserializer walk it in place
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                    try: self.__db = self._deserialize_buffer(buf, LOCAL_DATABASE_HEADER_LEN)
+                    except struct.error: raise ValueError(f"Database file '{self.__path}' is truncated")
 
     # functions that must be defined by inherited classes
 
@@ -235,6 +326,13 @@ class BaseDataset:
     def _deserialize(self, file: io.BufferedReader) ->    Set[Any]:           raise NotImplementedError()
     def _value_type( self, value: Any) -> Any:                                raise NotImplementedError()
 
+    def _deserialize_buffer(self, buf: mmap.mmap, offset: int) -> Set[Any]:
+        """
+        Deserializes straight from the mapped file, starting at `offset`. By
+        default this hands a copy to `_deserialize`; override it to skip that.
+        """
+        return self._deserialize(io.BytesIO(buf[offset:]))
+
 
 
 # predefined database types
@@ -262,26 +360,24 @@ class IntDatabase(BaseKeyValDatabase):
     `EE....EE`  N bytes for the value itself
     """
     def _serialize(self, file: io.BufferedWriter, data: Dict[str, int]) -> None:
-        num_entries = len(data)
-        file.write(num_entries.to_bytes(8))
+        # built up in memory, then written in one go
+        buf = bytearray(_U64.pack(len(data)))
         for k,v in data.items():
-            k = k.encode(); v = v.to_bytes(2)
-            file.write( len(k).to_bytes(4) ); file.write( k )
-            file.write( len(v).to_bytes(1) ); file.write( v )
+            k = k.encode(); v = _U16.pack(v)
+            buf += _U16.pack(len(k)); buf += k
+            buf += _U8.pack(len(v)); buf += v
+        file.write(buf)
     
-    def _deserialize(self, file: io.BufferedReader) -> Dict[str, int]:
+    def _deserialize_buffer(self, buf: mmap.mmap, off: int) -> Dict[str, int]:
         out = {}
-        def read_n(n: int):
-            data = file.read(n)
-            if len(data) != n: raise ValueError()
-            return data
-        num_entries = int.from_bytes(file.read(8))
+        num_entries, off = _read_count_at(buf, off)
         for i in range(num_entries):
-            keysize = int.from_bytes(read_n(2))
-            key     =                read_n(keysize).decode()
-            valsize = int.from_bytes(read_n(1))
-            val     = int.from_bytes(read_n(valsize))
+            keysize = _U16.unpack_from(buf, off)[0];    off += 2
+            key     = buf[off:off+keysize].decode();    off += keysize
+            valsize = _U8.unpack_from(buf, off)[0];     off += 1
+            val     = int.from_bytes(buf[off:off+valsize]); off += valsize
             out[key] = val
+        if off > len(buf): raise ValueError()
         return out
     
     def _value_type(self, value: Any) -> Any:
@@ -311,26 +407,24 @@ class StringDatabase(BaseKeyValDatabase):
     `EE....EE`  N bytes, decoded in utf-8 to produce the string value
     """
     def _serialize(self, file: io.BufferedWriter, data: Dict[str, str]) -> None:
-        num_entries = len(data)
-        file.write(num_entries.to_bytes(8))
+        # built up in memory, then written in one go
+        buf = bytearray(_U64.pack(len(data)))
         for k,v in data.items():
             k = k.encode(); v = v.encode()
-            file.write( len(k).to_bytes(2) ); file.write( k )
-            file.write( len(v).to_bytes(2) ); file.write( v )
+            buf += _U16.pack(len(k)); buf += k
+            buf += _U16.pack(len(v)); buf += v
+        file.write(buf)
     
-    def _deserialize(self, file: io.BufferedReader) -> Dict[str, str]:
+    def _deserialize_buffer(self, buf: mmap.mmap, off: int) -> Dict[str, str]:
         out = {}
-        def read_n(n: int):
-            data = file.read(n)
-            if len(data) != n: raise ValueError()
-            return data
-        num_entries = int.from_bytes(file.read(8))
+        num_entries, off = _read_count_at(buf, off)
         for i in range(num_entries):
-            keysize = int.from_bytes(read_n(2))
-            key     =                read_n(keysize).decode()
-            valsize = int.from_bytes(read_n(2))
-            val     =                read_n(valsize).decode()
+            keysize = _U16.unpack_from(buf, off)[0];    off += 2
+            key     = buf[off:off+keysize].decode();    off += keysize
+            valsize = _U16.unpack_from(buf, off)[0];    off += 2
+            val     = buf[off:off+valsize].decode();    off += valsize
             out[key] = val
+        if off > len(buf): raise ValueError()
         return out
     
     def _value_type(self, value: Any) -> Any:
@@ -357,56 +451,38 @@ class BoolDatabase(BaseKeyValDatabase):
     `BB BB`     Two bytes for the length of this key\n
     `CC....CC`  N bytes, decoded in utf-8 to produce the string key
 
-    Bytes are then read from the file, and each is decomposed into 8 bits. This
-    set of bits is then read as bools for the LAST eight keys, and this
-    repeats until no more keys are stored.
+    The values follow as `ceil(num_entries / 8)` bytes, packed eight to a byte
+    in key order, most significant bit first. Unused bits in the last byte are
+    zero.
     """
-    def __reverse_byte(self, n: int) -> int:
-        out = 0
-        for i in range(8):
-            out |= ((n >> (7-i)) & 1) << i
-        return out
-    
     def _serialize(self, file: io.BufferedWriter, data: Dict[str, bool]) -> None:
+        # built up in memory, then written in one go
         num_entries = len(data)
-        file.write(num_entries.to_bytes(8))
-        # write keys
+        buf = bytearray(_U64.pack(num_entries))
+        # keys
         for k in data.keys():
             k = k.encode()
-            file.write( len(k).to_bytes(2) ); file.write( k )
+            buf += _U16.pack(len(k)); buf += k
         # pack vals
-        packed = 0
-        for v in data.values():
-            packed <<= 1
-            packed |= v
-        # pad to integer multiple of byte width
-        if r:=num_entries%8:
-            packed <<= 8 - r
-            num_entries += r
-        # write packed vals
-        file.write(packed.to_bytes(num_entries//8))
-    
-    def _deserialize(self, file: io.BufferedReader) -> Dict[str, bool]:
+        packed = bytearray((num_entries + 7) // 8)
+        for i,v in enumerate(data.values()):
+            if v: packed[i >> 3] |= 0x80 >> (i & 7)
+        buf += packed
+        file.write(buf)
+    
+    def _deserialize_buffer(self, buf: mmap.mmap, off: int) -> Dict[str, bool]:
         keys = []
-        def read_n(n: int):
-            data = file.read(n)
-            if len(data) != n: raise ValueError()
-            return data
-        num_entries = int.from_bytes(read_n(8))
+        num_entries, off = _read_count_at(buf, off)
         # read keys
         for i in range(num_entries):
-            keysize = int.from_bytes(read_n(2))
-            key = read_n(keysize).decode()
-            keys.append(key)
-        # read vals
-        r = num_entries%8
-        packed = int.from_bytes(file.read( (num_entries+r) // 8 ))
-        packed >>= r  # undo to-multiple-integer-of-full-byte padding
-        # assign vals to keys
+            keysize = _U16.unpack_from(buf, off)[0];    off += 2
+            keys.append(buf[off:off+keysize].decode()); off += keysize
+        # read vals, and assign them to keys
+        packed = buf[off:off + (num_entries + 7) // 8]
+        if len(packed) != (num_entries + 7) // 8: raise ValueError()
         out = {}
-        for i in range(num_entries):
-            out[keys.pop()] = bool( packed & 1 )
-            packed >>= 1
+        for i,key in enumerate(keys):
+            out[key] = bool( packed[i >> 3] & (0x80 >> (i & 7)) )
         return out
     
     def _value_type(self, value: Any) -> Any:
@@ -436,26 +512,24 @@ class BytesDatabase(BaseKeyValDatabase):
     `EE....EE`  N bytes for the value itself
     """
     def _serialize(self, file: io.BufferedWriter, data: Dict[str, bytes]) -> None:
-        num_entries = len(data)
-        file.write(num_entries.to_bytes(8))
+        # built up in memory, then written in one go
+        buf = bytearray(_U64.pack(len(data)))
         for k,v in data.items():
             k = k.encode()
-            file.write( len(k).to_bytes(2) ); file.write( k )
-            file.write( len(v).to_bytes(2) ); file.write( v )
+            buf += _U16.pack(len(k)); buf += k
+            buf += _U16.pack(len(v)); buf += v
+        file.write(buf)
     
-    def _deserialize(self, file: io.BufferedReader) -> Dict[str, bytes]:
+    def _deserialize_buffer(self, buf: mmap.mmap, off: int) -> Dict[str, bytes]:
         out = {}
-        def read_n(n: int):
-            data = file.read(n)
-            if len(data) != n: raise ValueError()
-            return data
-        num_entries = int.from_bytes(file.read(8))
+        num_entries, off = _read_count_at(buf, off)
         for i in range(num_entries):
-            keysize = int.from_bytes(read_n(2))
-            key     =                read_n(keysize).decode()
-            valsize = int.from_bytes(read_n(2))
-            val     =                read_n(valsize)
+            keysize = _U16.unpack_from(buf, off)[0];    off += 2
+            key     = buf[off:off+keysize].decode();    off += keysize
+            valsize = _U16.unpack_from(buf, off)[0];    off += 2
+            val     = buf[off:off+valsize];             off += valsize
             out[key] = val
+        if off > len(buf): raise ValueError()
         return out
     
     def _value_type(self, value: Any) -> Any:
@@ -482,7 +556,21 @@ class IntDataset(BaseDataset):
     Stores a set of unique integers.
     Inherits from :class:`ordinance.database.BaseDataset`.
     
-    Data in the file is laid out as follows:
+    Data in the file is laid out as follows. When every value fits in four
+    unsigned bytes (the usual case), the values are packed back to back:
+
+    ```
+    eight bytes
+    containing
+    the num of        one such
+      entries          entry
+    .----|----.      .----|----.
+    AA ..... AA  00  BB BB BB BB [more entries]-->
+    ```
+    `00`           A zero byte, marking the packed layout\n
+    `BB BB BB BB`  Four bytes for the value itself
+
+    Otherwise, each value carries its own length:
 
     ```
     eight bytes
@@ -494,28 +582,35 @@ class IntDataset(BaseDataset):
     ```
     Each entry consists of:
     
-    `BB`        One byte for the length of this value\n
+    `BB`        One byte for the length of this value (never zero)\n
     `CC....CC`  N bytes for the value itself
     """
     def _serialize(self, file: io.BufferedWriter, data: Set[int]) -> None:
         num_entries = len(data)
-        file.write(num_entries.to_bytes(8))
+        try: packed = struct.pack(f'>{num_entries}I', *data)
+        except struct.error: packed = None
+        if packed is not None:
+            file.write(_U64.pack(num_entries) + b'\x00' + packed)
+            return
+        # built up in memory, then written in one go
+        buf = bytearray(_U64.pack(num_entries))
         for v in data:
-            v = v.to_bytes(4)
-            file.write( len(v).to_bytes(1) ); file.write( v )
-    
-    def _deserialize(self, file: io.BufferedReader) -> Set[int]:
-        out = set()
-        def read_n(n: int):
-            data = file.read(n)
-            if len(data) != n: raise ValueError()
-            return data
-        num_entries = int.from_bytes(file.read(8))
+            v = v.to_bytes((v.bit_length() + 7) // 8 or 1)
+            buf += _U8.pack(len(v)); buf += v
+        file.write(buf)
+    
+    def _deserialize_buffer(self, buf: mmap.mmap, off: int) -> Set[int]:
+        num_entries, off = _read_count_at(buf, off)
+        if not num_entries: return set()
+        if buf[off] == 0:
+            # packed layout; unpacked in one call
+            return set(struct.unpack_from(f'>{num_entries}I', buf, off + 1))
+        vals = []
         for i in range(num_entries):
-            valsize = int.from_bytes(read_n(1))
-            val     = int.from_bytes(read_n(valsize))
-            out.add(val)
-        return out
+            valsize = _U8.unpack_from(buf, off)[0];     off += 1
+            vals.append(int.from_bytes(buf[off:off+valsize])); off += valsize
+        if off > len(buf): raise ValueError()
+        return set(vals)
     
     def _value_type(self, value: Any) -> Any:
         try: return int(value)
@@ -542,24 +637,21 @@ class StringDataset(BaseDataset):
     `CC....CC`     N bytes, decoded in utf-8 to produce the string value
     """
     def _serialize(self, file: io.BufferedWriter, data: Set[str]) -> None:
-        num_entries = len(data)
-        file.write(num_entries.to_bytes(8))
+        # built up in memory, then written in one go
+        buf = bytearray(_U64.pack(len(data)))
         for v in data:
             v = v.encode()
-            file.write( len(v).to_bytes(4) ); file.write( v )
-    
-    def _deserialize(self, file: io.BufferedReader) -> Set[str]:
-        out = set()
-        def read_n(n: int):
-            data = file.read(n)
-            if len(data) != n: raise ValueError()
-            return data
-        num_entries = int.from_bytes(file.read(8))
+            buf += _U32.pack(len(v)); buf += v
+        file.write(buf)
+    
+    def _deserialize_buffer(self, buf: mmap.mmap, off: int) -> Set[str]:
+        vals = []
+        num_entries, off = _read_count_at(buf, off)
         for i in range(num_entries):
-            valsize = int.from_bytes(read_n(4))
-            val = read_n(valsize).decode()
-            out[key] = val
-        return out
+            valsize = _U32.unpack_from(buf, off)[0];    off += 4
+            vals.append(buf[off:off+valsize].decode()); off += valsize
+        if off > len(buf): raise ValueError()
+        return set(vals)
     
     def _value_type(self, value: Any) -> Any:
         try: return str(value)
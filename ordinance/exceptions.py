@@ -11,11 +11,20 @@ from typing import Coroutine
 class OrdinanceError(Exception):
     """ Any exception that stems from Ordinance. """
     def __init__(self, message: str, e: Exception = None):
-        if e is not None:
+        super().__init__(str(message))
+        # the inner traceback is only formatted if this is ever printed, since
+        # plenty of these are caught and dropped without being read
+        self._inner = e
+        self._str = None
+
+    def __str__(self) -> str:
+        if self._inner is None: return super().__str__()
+        if self._str is None:
+            e = self._inner
             before = f" {str(type(e))[8:-2]}"
-            tb = traceback.format_exc()
-            super().__init__(f"{before}\n{message}{tb}\n")
-        else: super().__init__(str(message))
+            tb = ''.join(traceback.format_exception(e))
+            self._str = f"{before}\n{self.args[0]}{tb}\n"
+        return self._str
 
 class NotRootException(Exception):
     """ Ordinance must be run as root. """
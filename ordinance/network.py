@@ -1,8 +1,11 @@
 import re
-import os
 import io
+import mmap
+import socket
+import struct
 import subprocess
 import threading
+import functools
 
 from typing import (
     Union,
@@ -28,22 +31,24 @@ import ordinance.database
 
 def clean_ip(ip: str):
     # if IP is cidr, strip net
-    if "/" in ip:  ip = ip.split("/")[0]
+    # the `in` check keeps plain addresses free of any allocation; partition
+    # then cuts the net off without building a list
+    if "/" in ip:  ip = ip.partition("/")[0]
     # TODO more?
     return ip
 
 ## stolen from Artillery src.core
 def is_addr_within_network(ip, net):
     try:
-        ipaddr = int(''.join([ '%02x' % int(x) for x in ip.split('.') ]), 16)
         netstr, bits = net.split('/')
-        netaddr = int(''.join([ '%02x' % int(x) for x in netstr.split('.') ]), 16)
         mask = (0xffffffff << (32 - int(bits))) & 0xffffffff
-        return (ipaddr & mask) == (netaddr & mask)
-    except:
+        return (ip_to_int(ip) & mask) == (ip_to_int(netstr) & mask)
+    except Exception:
        return False
 
 ## stolen from Artillery src.core
+# case is spelled out in the pattern rather than using IGNORECASE, and
+# ASCII keeps \d to 0-9; both are cheaper per character at match time
 _pattern = re.compile(r"""
 ^
 (?:
@@ -52,7 +57,7 @@ _pattern = re.compile(r"""
     # Decimal 1-255 (no leading 0's)
     [3-9]\d?|2(?:5[0-5]|[0-4]?\d)?|1\d{0,2}
   |
-    0x0*[0-9a-f]{1,2}  # Hexadecimal 0x0 - 0xFF (possible leading 0's)
+    0[xX]0*[0-9a-fA-F]{1,2}  # Hexadecimal 0x0 - 0xFF (possible leading 0's)
   |
     0+[1-3]?[0-7]{0,2} # Octal 0 - 0377 (possible leading 0's)
   )
@@ -61,13 +66,13 @@ _pattern = re.compile(r"""
     (?:
       [3-9]\d?|2(?:5[0-5]|[0-4]?\d)?|1\d{0,2}
     |
-      0x0*[0-9a-f]{1,2}
+      0[xX]0*[0-9a-fA-F]{1,2}
     |
       0+[1-3]?[0-7]{0,2}
     )
   ){0,3}
 |
-  0x0*[0-9a-f]{1,8}    # Hexadecimal notation, 0x0 - 0xffffffff
+  0[xX]0*[0-9a-fA-F]{1,8}    # Hexadecimal notation, 0x0 - 0xffffffff
 |
   0+[0-3]?[0-7]{0,10}  # Octal notation, 0 - 037777777777
 |
@@ -77,37 +82,42 @@ _pattern = re.compile(r"""
   4[01]\d{8}|[1-3]\d{0,9}|[4-9]\d{0,8}
 )
 $
-""", re.VERBOSE | re.IGNORECASE)
+""", re.VERBOSE | re.ASCII)
+# every character _pattern can match; anything else is rejected up front
+_ipv4_chars = frozenset("0123456789abcdefABCDEFxX.")
+
 def is_valid_ipv4(ip):
-    return _pattern.match(clean_ip(ip)) is not None
+    ip = clean_ip(ip)
+    # most garbage (hostnames, IPv6, stray whitespace) fails on the charset
+    # alone, without ever reaching inet_pton or the regex
+    if not ip or not _ipv4_chars.issuperset(ip): return False
+    # plain dotted-quad is by far the common case, and inet_pton validates it
+    # in C. it accepts a strict subset of _pattern, so anything it rejects
+    # (hex, octal, shorthand...) still gets the full check
+    try: socket.inet_pton(socket.AF_INET, ip); return True
+    except OSError: pass
+    return _pattern.match(ip) is not None
+
+# one big-endian u32, the packed form of an IPv4 address
+_IP_STRUCT = struct.Struct('!I')
+
+@functools.lru_cache(maxsize=4096)
+def _parse_ip(ip: str) -> int:
+    # inet_pton does the whole parse in C, and (unlike inet_aton) only takes
+    # plain dotted-quad, so shorthand like '10.1' or '0x7f.1' is still rejected.
+    # the same few addresses tend to come up over and over, hence the cache;
+    # failures raise, so they're never cached
+    return _IP_STRUCT.unpack(socket.inet_pton(socket.AF_INET, ip))[0]
 
 def ip_to_int(ip: str) -> int:
     """ Encodes a str IP to an int. """
-    def intff(i):  # used to just return (int(i) & 0xFF), hence the name
-        try: i = int(i); assert 255 >= i >= 0; return i
-        except: raise ValueError()
-    try:
-        p1,p2,p3,p4 = clean_ip(ip).split('.')
-        p1,p2,p3,p4 = intff(p1),intff(p2),intff(p3),intff(p4)
-        return (
-            (p1 << 24) |  # 0xXX......
-            (p2 << 16) |  # 0x..XX....
-            (p3 << 8 ) |  # 0x....XX..
-            (p4      )    # 0x......XX
-        )
-    except:
-        raise ordinance.exceptions.IPInvalid(ip)
+    try: return _parse_ip(clean_ip(ip))
+    except (OSError, TypeError, ValueError): raise ordinance.exceptions.IPInvalid(ip)
 
 def int_to_ip(iip: int) -> str:
     """ Resolves an int-encoded IP to a str. """
-    try:
-        p1 = (iip >> 24) & 0xFF  # 0xXX......
-        p2 = (iip >> 16) & 0xFF  # 0x..XX....
-        p3 = (iip >> 8 ) & 0xFF  # 0x....XX..
-        p4 = (iip      ) & 0xFF  # 0x......XX
-        return f"{p1}.{p2}.{p3}.{p4}"
-    except:
-        raise ordinance.exceptions.IPInvalid(iip)
+    try: return socket.inet_ntoa(_IP_STRUCT.pack(iip))
+    except struct.error: raise ordinance.exceptions.IPInvalid(iip)
 
 class IPv4Dataset(ordinance.database.BaseDataset):
     """
@@ -129,21 +139,14 @@ class IPv4Dataset(ordinance.database.BaseDataset):
     `BB BB BB BB`  Four bytes for this value
     """
     def _serialize(self, file: io.BufferedWriter, data: Set[int]) -> None:
+        # the count and every entry, packed in one call and written in one go
         num_entries = len(data)
-        file.write(num_entries.to_bytes(8))
-        for v in data: file.write( v.to_bytes(4) )
+        file.write(struct.pack(f'>Q{num_entries}I', num_entries, *data))
     
-    def _deserialize(self, file: io.BufferedReader) -> Set[int]:
-        out = set()
-        def read_n(n: int):
-            data = file.read(n)
-            if len(data) != n: raise ValueError()
-            return data
-        num_entries = int.from_bytes(file.read(8))
-        for i in range(num_entries):
-            val = int.from_bytes(read_n(4))
-            out.add(val)
-        return out
+    def _deserialize_buffer(self, buf: mmap.mmap, off: int) -> Set[int]:
+        if off == len(buf): return set()  # only the header; empty
+        num_entries = struct.unpack_from('>Q', buf, off)[0]
+        return set(struct.unpack_from(f'>{num_entries}I', buf, off + 8))
     
     def _value_type(self, value: Any) -> Any:
         try:
@@ -154,8 +157,8 @@ class IPv4Dataset(ordinance.database.BaseDataset):
                 return ip_to_int(value)
         except: raise ValueError()
 
-blacklist = IPv4Dataset('storage/core.network.blacklist.database', name="global_whitelist")
-whitelist = IPv4Dataset('storage/core.network.whitelist.database', name="global_blacklist")
+blacklist = IPv4Dataset('storage/core.network.blacklist.database', name="global_blacklist")
+whitelist = IPv4Dataset('storage/core.network.whitelist.database', name="global_whitelist")
 
 
 
@@ -167,19 +170,16 @@ def flush_blacklist_to_iptables() -> None:
     ordinance.writer.info("Flushing blacklist to ipset...")
     if len(blacklist) > 65536:  # TODO make this work for >65536
         raise ordinance.exceptions.NetworkException("Too many blacklisted IPs (>65536)")
-    # make new /tmp/ directory
-    (ret, tmpfile) = ordinance.util.run_shell_cmd("mktemp")
-    if ret:  raise ordinance.exceptions.NetworkException("Call to 'mktemp' failed")
-    # open temp file and write IPs
-    ordinance.writer.debug(f"Writing to tmpfile {tmpfile}")
-    with open(tmpfile, 'w') as file:
-        for ip in blacklist.iter():
-            file.write(f'add "ORDINANCE_BLACKLIST" {ip}\n')
+    # build the whole restore script in memory and pipe it straight in, rather
+    # than writing it line by line to a tmpfile
+    pack, ntoa = _IP_STRUCT.pack, socket.inet_ntoa
+    script = ''.join([f'add "ORDINANCE_BLACKLIST" {ntoa(pack(ip))}\n' for ip in blacklist.iter()])
     # fill ipset
-    with open(tmpfile, 'r') as file:
-        (ret, res) = ordinance.util.run_shell_cmd('ipset restore', inpipe=file)
-    if ret:
-        ordinance.writer.error(f"Call to 'ipset restore' returned {ret}\n{res}")
+    proc = subprocess.run(['ipset', 'restore'], input=script.encode(),
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    if proc.returncode:
+        res = (proc.stderr or proc.stdout).decode().strip()
+        ordinance.writer.error(f"Call to 'ipset restore' returned {proc.returncode}\n{res}")
         raise ordinance.exceptions.NetworkException("Call to 'ipset restore' failed")
     # attach to chain
     cmd = f"iptables -I ORDINANCE -m set --match-set ORDINANCE_BLACKLIST src -j DROP"
@@ -187,8 +187,6 @@ def flush_blacklist_to_iptables() -> None:
     if ret:
         ordinance.writer.error(f"Call to 'iptables' returned {ret}\n{res}")
         raise ordinance.exceptions.NetworkException("Call to 'iptables' failed")
-    # clean up
-    os.remove(tmpfile)
     ordinance.writer.success(f"Flushed blacklist to ipset.")
 
 def create_iptables_rule(
@@ -12,6 +12,19 @@ class OrdinancePlugin:
         # default, just output that this plugin has been inited.
         ordinance.writer.info(f"{self.name}: Initialized.")
 
+    def __init_subclass__(cls, **kwargs):
+        # collect the scheduled and command methods once, when the plugin class
+        # is defined, so loading the plugin doesn't have to scan the class
+        super().__init_subclass__(**kwargs)
+        cls.__schedules__ = {}
+        cls.__commands__ = {}
+        for name,attr in cls.__dict__.items():
+            if isinstance(attr, ordinance.schedule.ScheduledFunction):
+                cls.__schedules__[name] = attr
+            commands = getattr(attr, '__ordinance_commands', None)
+            if commands is not None:
+                cls.__commands__[name] = commands
+
 
     # the following functions use variables defined during plugin preinit, so
     # the type checker might complain.
@@ -60,12 +60,18 @@ class ScheduledFunction:
     def __repr__(self) -> str:
         return f"<ScheduledFunction tied to f{repr(self.__callback)}>"
     
-    def __call__(self, plugin_instance, daemonic: Optional[bool] = False) -> threading.Thread:
+    def _run(self, plugin_instance) -> None:
+        """ Runs the callback in the calling thread, logging any exception. """
+        try: self.__callback(plugin_instance)
+        except Exception as e:
+            ordinance.writer.error("Failed to call ScheduledFunction callback:")
+            ordinance.writer.error(e)
+
+    def __call__(self, plugin_instance, daemonic: Optional[bool] = False, on_done: Optional[Callable[[threading.Thread], Any]] = None) -> threading.Thread:
         def _exc_wrap(*args):
-            try: self.__callback(*args)
-            except Exception as e:
-                ordinance.writer.error("Failed to call ScheduledFunction callback:")
-                ordinance.writer.error(e)
+            try: self._run(*args)
+            finally:
+                if on_done is not None: on_done(threading.current_thread())
         thread = threading.Thread(
             target=_exc_wrap,
             args=(plugin_instance,),
@@ -103,9 +109,9 @@ class ScheduledFunction:
             # create new class
             new = trig_cls(id, daemonic, *args)
             # make sure data isn't clashing
-            for id,trig in self.__triggers.items():
+            for trig in self.__triggers.values():
                 if new == trig:
-                    raise ordinance.exceptions.SchedulerError(data_class_fail_message)
+                    raise ordinance.exceptions.SchedulerError(data_clash_fail_message)
             # good! append and return
             self.__triggers[id] = new
         return id
@@ -115,13 +121,10 @@ class ScheduledFunction:
         day_total = 60*60*24
         week_total = day_total * 7
         month_total = day_total * 28  # assumes worst-case of February
-        # check for bad cal type
-        def _cap(totlen):
-            while into_sec < 0:      into_sec += totlen
-            while into_sec > totlen: into_sec -= totlen
-        if align_to == 'day':     _cap(day_total)
-        elif align_to == 'week':  _cap(week_total)
-        elif align_to == 'month': _cap(month_total)
+        # check for bad cal type, and wrap the offset into the period
+        if align_to == 'day':     into_sec %= day_total
+        elif align_to == 'week':  into_sec %= week_total
+        elif align_to == 'month': into_sec %= month_total
         else: raise ordinance.exceptions.SchedulerError(
             f"Unknown calendar type '{align_to}' (must be 'day', 'week', or 'month')")
         # everything good. make and return
@@ -133,7 +136,7 @@ class ScheduledFunction:
         delta = delay.total_seconds()
         return self.__add_trigger(DelayTrigger,
             f"Delay trigger of {delta} seconds already registered",
-            id, daemonic, delay)
+            id, daemonic, delta)
     
     def add_event_trigger(self, event: str, id: Optional[str] = None, daemonic: Optional[bool] = False) -> str:
         return self.__add_trigger(EventTrigger,
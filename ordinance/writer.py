@@ -1,5 +1,8 @@
+import atexit
+import collections
 import datetime
 import threading
+import time
 
 from typing import (
     Dict,
@@ -8,6 +11,7 @@ from typing import (
     Any,
     Union,
     Optional,
+    Tuple,
     Coroutine
 )
 
@@ -16,6 +20,7 @@ import ordinance.exceptions
 
 
 class Message:
+    __slots__ = ('message', 'importance', 'timestamp', '_time', '_text')
 
     # criticality levels
     ALRT = 0x40
@@ -34,17 +39,59 @@ class Message:
     SUCCESS = SUCC
     DEBUG = DBUG
 
-    def __init__(self, msg: List[Any], importance: int):
-        self.message = msg
+    LEVELS = (DBUG, INFO, SUCC, WARN, ERRR, CRIT, ALRT)
+    ALL = DBUG | INFO | SUCC | WARN | ERRR | CRIT | ALRT
+
+    def __init__(self, msg: Tuple[Any, ...], importance: int):
+        self.message = msg if type(msg) is tuple else tuple(msg)
         self.importance = importance
-        self.time = datetime.datetime.now()
+        # the clock is read now, since writers handle the message later; the
+        # datetime is only built for writers that actually format it
+        self.timestamp = time.time()
+        self._time = None
+        self._text = None
+
+    @property
+    def time(self) -> datetime.datetime:
+        """ When the message was emitted, as a local datetime. """
+        if self._time is None:
+            self._time = datetime.datetime.fromtimestamp(self.timestamp)
+        return self._time
+
+    @property
+    def text(self) -> str:
+        """ The message parts joined into one string. Computed once, and shared
+        by every writer the message is dispatched to. """
+        if self._text is None:
+            parts = self.message
+            # most callers pass only strings, which join can take as-is
+            if all(type(p) is str for p in parts): self._text = ' '.join(parts)
+            else: self._text = ' '.join(map(str, parts))
+        return self._text
 
 
 
 class WriterBase():
-    """ Base writer class. """
+    """
+    Base writer class. Messages are queued by the caller and handed to the
+    writer from its own drain thread, so a slow sink never blocks a producer.
+    """
+
+    # importance levels this writer wants; others are never sent to it
+    accepted_mask: int = Message.ALL
+    # seconds the drain thread lingers after waking, so a burst of messages
+    # reaches handle_batch as one batch. the wait is outside the handle lock
+    coalesce_window: float = 0.0
+
     def __init__(self, config: Dict[str, Any]):
         self._handle_lock = threading.Lock()
+        self._queue: "collections.deque[Message]" = collections.deque()
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        # started on the first message, so a writer that fails to construct
+        # doesn't leave a thread behind
+        self._drain_thread: Optional[threading.Thread] = None
+        self._drain_start_lock = threading.Lock()
 
 
     ## Overwritten functions
@@ -52,6 +99,15 @@ class WriterBase():
     def handle(self, message: Message):
         raise NotImplementedError()
 
+    def handle_batch(self, messages: List[Message]):
+        """
+        Handles every message queued since the last drain, in order. Writers
+        that can do better than one handle() per message can override this.
+        """
+        for message in messages:
+            try: self.handle(message)
+            except Exception as e: print(f"{type(self).__name__}: Failed to handle message: ", e)
+
     def close(self):
         """
         Some writers can override this to make sure they are closed properly.
@@ -59,40 +115,82 @@ class WriterBase():
         """
     
     
+    ## Drain thread
+
+    def _emit(self, message: Message):
+        # no lock on the producer side: deque.append is atomic, and Event.set
+        # (which does take a lock) is skipped while the drain thread is
+        # already due to wake. it clears the event before it pops, so anything
+        # appended before that check is still picked up
+        self._queue.append(message)
+        if self._drain_thread is None: self._start_drain()
+        if not self._wake.is_set(): self._wake.set()
+
+    def _start_drain(self):
+        with self._drain_start_lock:
+            if self._drain_thread is not None: return
+            self._drain_thread = threading.Thread(target=self._drain, daemon=True,
+                name=f"Writer-{type(self).__name__}_Drain_Thread")
+            self._drain_thread.start()
+
+    def _drain(self):
+        queue = self._queue
+        while True:
+            self._wake.wait()
+            # cut short by _stop_drain, so shutdown never waits out a window
+            if self.coalesce_window: self._stopping.wait(self.coalesce_window)
+            self._wake.clear()
+            batch = []
+            while True:
+                try: batch.append(queue.popleft())
+                except IndexError: break
+            if batch:
+                with self._handle_lock:
+                    try: self.handle_batch(batch)
+                    except Exception as e: print(f"{type(self).__name__}: Failed to handle messages: ", e)
+            if self._stopping.is_set() and not queue: return
+
+    def _stop_drain(self):
+        """ Handles everything still queued, then stops the drain thread. """
+        self._stopping.set()
+        self._wake.set()
+        if self._drain_thread is not None and self._drain_thread is not threading.current_thread():
+            self._drain_thread.join()
+
+
     ## Passed-down functions
     
     def debug(self, *msg):
-        with self._handle_lock:
-            self.handle(Message(msg, Message.DBUG))
+        if self.accepted_mask & Message.DBUG: self._emit(Message(msg, Message.DBUG))
     
     def info(self, *msg):
-        with self._handle_lock:
-            self.handle(Message(msg, Message.INFO))
+        if self.accepted_mask & Message.INFO: self._emit(Message(msg, Message.INFO))
     
     def success(self, *msg):
-        with self._handle_lock:
-            self.handle(Message(msg, Message.SUCC))
+        if self.accepted_mask & Message.SUCC: self._emit(Message(msg, Message.SUCC))
     
     def warn(self, *msg):
-        with self._handle_lock:
-            self.handle(Message(msg, Message.WARN))
+        if self.accepted_mask & Message.WARN: self._emit(Message(msg, Message.WARN))
     
     def error(self, *msg):
-        with self._handle_lock:
-            self.handle(Message(msg, Message.ERRR))
+        if self.accepted_mask & Message.ERRR: self._emit(Message(msg, Message.ERRR))
     
     def critical(self, *msg):
-        with self._handle_lock:
-            self.handle(Message(msg, Message.CRIT))
+        if self.accepted_mask & Message.CRIT: self._emit(Message(msg, Message.CRIT))
     
     def alert(self, *msg):
-        with self._handle_lock:
-            self.handle(Message(msg, Message.ALRT))
+        if self.accepted_mask & Message.ALRT: self._emit(Message(msg, Message.ALRT))
 
 
 
 __enabled: List[WriterBase] = []
 __classes: Dict[str, WriterBase] = {}
+# the enabled writers that accept each level; rebuilt on enable/disable
+__routes: Dict[int, Tuple[WriterBase, ...]] = { level: () for level in Message.LEVELS }
+
+def _reroute() -> None:
+    for level in Message.LEVELS:
+        __routes[level] = tuple(w for w in __enabled if w.accepted_mask & level)
 
 def add_writer_type(name: str, writer_class: WriterBase) -> None:
     if name in __classes:
@@ -108,6 +206,7 @@ def enable(name: str, config: Dict[str, Any]) -> None:
             raise ordinance.exceptions.WriterAlreadyEnabled(name)
     obj = typ(config)
     __enabled.append(obj)
+    _reroute()
 
 def disable(name: str) -> None:
     if name not in __classes:
@@ -115,6 +214,9 @@ def disable(name: str) -> None:
     typ = __classes[name]
     for writer in __enabled:
         if isinstance(writer, typ):
+            __enabled.remove(writer)
+            _reroute()
+            writer._stop_drain()
             writer.close(); return
     raise ordinance.exceptions.WriterAlreadyDisabled(name)
 
@@ -128,17 +230,41 @@ def get_enabled() -> Set[str]:
 def get_known() -> Set[str]:
     return set(__classes.keys())
 
+def is_debug_enabled() -> bool:
+    """
+    Returns whether a debug message would currently reach any writer. Useful
+    for skipping expensive message formatting on hot paths.
+    """
+    return len(__routes[Message.DBUG]) > 0
+
+@atexit.register
+def _flush_enabled():
+    # drain threads are daemonic; don't lose what's queued if the process
+    # exits without disabling its writers
+    for writer in list(__enabled): writer._stop_drain()
+
+def _dispatch(writers: Tuple[WriterBase, ...], message: Message):
+    # one Message for every writer, so its text is only built once
+    for writer in writers: writer._emit(message)
+
 def debug(*msg):
-    for writer in __enabled: writer.debug(*msg)
+    writers = __routes[Message.DBUG]
+    if writers: _dispatch(writers, Message(msg, Message.DBUG))
 def info(*msg):
-    for writer in __enabled: writer.info(*msg)
+    writers = __routes[Message.INFO]
+    if writers: _dispatch(writers, Message(msg, Message.INFO))
 def success(*msg):
-    for writer in __enabled: writer.success(*msg)
+    writers = __routes[Message.SUCC]
+    if writers: _dispatch(writers, Message(msg, Message.SUCC))
 def warn(*msg):
-    for writer in __enabled: writer.warn(*msg)
+    writers = __routes[Message.WARN]
+    if writers: _dispatch(writers, Message(msg, Message.WARN))
 def error(*msg):
-    for writer in __enabled: writer.error(*msg)
+    writers = __routes[Message.ERRR]
+    if writers: _dispatch(writers, Message(msg, Message.ERRR))
 def critical(*msg):
-    for writer in __enabled: writer.critical(*msg)
+    writers = __routes[Message.CRIT]
+    if writers: _dispatch(writers, Message(msg, Message.CRIT))
 def alert(*msg):
-    for writer in __enabled: writer.alert(*msg)
+    writers = __routes[Message.ALRT]
+    if writers: _dispatch(writers, Message(msg, Message.ALRT))